@@ -8,15 +8,29 @@ import os
 from pathlib import Path
 from PyQt6.QtWidgets import QGraphicsView, QGraphicsScene, QWidget, QVBoxLayout, QGraphicsPixmapItem, QSizePolicy
 from PyQt6.QtCore import Qt, pyqtSignal, QObject, QRectF
-from PyQt6.QtGui import QPixmap, QPainter, QBrush, QColor, QImage
+from PyQt6.QtGui import QPixmap, QPixmapCache, QPainter, QBrush, QColor, QImage
 from PyQt6.QtMultimedia import QMediaPlayer, QCamera, QMediaCaptureSession
 from PyQt6.QtMultimediaWidgets import QGraphicsVideoItem
 
 # Global cache for PNG analysis results
 _png_analysis_cache = {}
 
+# QPixmapCache budget in KB, large enough to keep a full effects tab decoded
+EFFECT_PIXMAP_CACHE_KB = 100 * 1024
+
+def load_effect_pixmap(file_path):
+    """Load an effect PNG through the process-wide QPixmapCache.
+    Every consumer (output widget, test overlays, ...) shares one decoded copy.
+    """
+    pixmap = QPixmapCache.find(file_path)
+    if pixmap is None:
+        pixmap = QPixmap(file_path)
+        if not pixmap.isNull():
+            QPixmapCache.insert(file_path, pixmap)
+    return pixmap
+
 def analyze_transparent_area_fast(pixmap, file_path=None):
-    """Fast analysis of transparent area with caching"""
+    """Fast analysis of transparent area with caching (accepts a QPixmap or a QImage)"""
     # Use file path as cache key if available
     cache_key = file_path if file_path else id(pixmap)
     
@@ -28,7 +42,7 @@ def analyze_transparent_area_fast(pixmap, file_path=None):
         return None
     
     # Convert to QImage to access pixel data
-    image = pixmap.toImage()
+    image = pixmap if isinstance(pixmap, QImage) else pixmap.toImage()
     if image.isNull():
         return None
     
@@ -84,7 +98,9 @@ def analyze_transparent_area(pixmap, file_path=None):
     return analyze_transparent_area_fast(pixmap, file_path)
 
 def preanalyze_effects_folder(effects_folder_path):
-    """Pre-analyze all PNG files in the effects folder for faster loading"""
+    """Pre-analyze all PNG files in the effects folder for faster loading.
+    Only uses QImage, so it may run on a worker thread.
+    """
     if not os.path.exists(effects_folder_path):
         return
     
@@ -98,9 +114,9 @@ def preanalyze_effects_folder(effects_folder_path):
                 file_path = os.path.join(root, file)
                 try:
                     # Load and analyze the PNG
-                    pixmap = QPixmap(file_path)
-                    if not pixmap.isNull():
-                        analyze_transparent_area_fast(pixmap, file_path)
+                    image = QImage(file_path)
+                    if not image.isNull():
+                        analyze_transparent_area_fast(image, file_path)
                         analyzed_count += 1
                 except Exception as e:
                     print(f"Error pre-analyzing {file_path}: {e}")
@@ -246,7 +262,7 @@ class GraphicsOutputWidget(QGraphicsView):
         try:
             if frame_path and os.path.exists(frame_path):
                 self.current_frame_path = frame_path
-                pixmap = QPixmap(frame_path)
+                pixmap = load_effect_pixmap(frame_path)
                 
                 if not pixmap.isNull():
                     # Remove existing overlay if any
@@ -591,6 +607,7 @@ class GraphicsOutputManager(QObject):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.output_widgets = {}  # Dictionary to store output widgets
+        self._last_effect = {}  # widget name -> frame path currently applied
         
     def create_output_widget(self, name, parent=None):
         """Create a new graphics output widget"""
@@ -613,7 +630,14 @@ class GraphicsOutputManager(QObject):
         """Set frame for a specific output widget"""
         widget = self.get_output_widget(widget_name)
         if widget:
+            # Same effect re-selected: skip the reload/rescale/remask pass
+            if frame_path and self._last_effect.get(widget_name) == frame_path and widget.has_frame():
+                return
             widget.set_frame_overlay(frame_path)
+            if frame_path and widget.overlay_item is not None:
+                self._last_effect[widget_name] = frame_path
+            else:
+                self._last_effect.pop(widget_name, None)
             if frame_path:
                 self.frame_applied.emit(frame_path)
             else:
@@ -624,12 +648,14 @@ class GraphicsOutputManager(QObject):
         widget = self.get_output_widget(widget_name)
         if widget:
             widget.clear_frame_overlay()
+            self._last_effect.pop(widget_name, None)
             self.frame_cleared.emit()
     
     def clear_all_frames(self):
         """Clear frames from all output widgets"""
         for widget in self.output_widgets.values():
             widget.clear_frame_overlay()
+        self._last_effect.clear()
         self.frame_cleared.emit()
     
     def get_active_frames(self):
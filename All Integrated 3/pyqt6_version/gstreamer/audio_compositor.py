@@ -19,6 +19,9 @@ Public API:
   - remove_source(name: str) -> None
   - set_input_volume(name: str, vol: float) -> None
   - set_master_volume(vol: float) -> None
+  - begin_update() / commit_update() -> None  (batch several source changes)
+  - apply_mix_state(volumes: dict, present_media: set) -> list
+  - apply_routing(active, stype, media_files, muted, master_muted) -> list
 
 Notes:
   - This module focuses on live volume control. Integrating real media/player audio
@@ -26,7 +29,7 @@ Notes:
 """
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional
 
 import gi  # type: ignore
 try:
@@ -54,6 +57,11 @@ class AudioCompositor:
         self._inputs: Dict[str, Dict[str, Gst.Element]] = {}
         # Inter-audio channel name for external pipelines
         self.channel_name: str = "ac_audio_bus"
+        # Batched updates: nesting depth and elements awaiting a state sync
+        self._update_depth: int = 0
+        self._pending_sync: list = []
+        # Last volume apply_mix_state() set per input; anything else touching an input drops it
+        self._applied_mix: Dict[str, float] = {}
 
     def start(self) -> None:
         if self._pipeline:
@@ -197,8 +205,7 @@ class AudioCompositor:
         }
 
         # Ensure playing state for newly added elements
-        for el in (src, conv, res, vol, q):
-            el.sync_state_with_parent()
+        self._sync_new_elements((src, conv, res, vol, q))
 
     def add_media_file_source(self, name: str, file_path: str) -> None:
         """Create and add a media file audio source into the mixer under the given logical name.
@@ -290,12 +297,12 @@ class AudioCompositor:
         }
 
         # Ensure playing state for newly added elements
-        for el in (decode, conv, res, vol, q):
-            el.sync_state_with_parent()
+        self._sync_new_elements((decode, conv, res, vol, q))
 
     def remove_source(self, name: str) -> None:
         if not self._pipeline:
             return
+        self._applied_mix.pop(name, None)
         info = self._inputs.pop(name, None)
         if not info:
             return
@@ -309,8 +316,34 @@ class AudioCompositor:
                 except Exception:
                     pass
 
+    # ------------- Batched updates -------------
+    def begin_update(self) -> None:
+        """Start a batch of source changes; new elements are brought up together on commit_update()."""
+        self._update_depth += 1
+
+    def commit_update(self) -> None:
+        """Finish a batch started with begin_update(). Nested batches apply on the outermost commit."""
+        if self._update_depth == 0:
+            return
+        self._update_depth -= 1
+        if self._update_depth:
+            return
+        pending, self._pending_sync = self._pending_sync, []
+        for el in pending:
+            # Skip elements whose source was removed again within the same batch
+            if el.get_parent() is not None:
+                el.sync_state_with_parent()
+
+    def _sync_new_elements(self, elements) -> None:
+        if self._update_depth:
+            self._pending_sync.extend(elements)
+            return
+        for el in elements:
+            el.sync_state_with_parent()
+
     # ------------- Volumes -------------
     def set_input_volume(self, name: str, vol: float) -> None:
+        self._applied_mix.pop(name, None)
         vol = max(0.0, min(1.0, float(vol)))
         info = self._inputs.get(name)
         if not info:
@@ -320,6 +353,59 @@ class AudioCompositor:
         if volume_el is not None:
             volume_el.set_property('volume', vol)
 
+    def apply_mix_state(self, volumes: Dict[str, float], present_media: Iterable[str] = ()) -> List[str]:
+        """Bring the mix to the given per-input volumes in one pass.
+
+        Volumes of 0.0 mute the input. Only inputs whose volume differs from the last
+        apply_mix_state() call are touched. Media sources (``media*``) not listed in
+        present_media are removed; their names are returned.
+        """
+        keep = set(present_media)
+        removed = [n for n in self._inputs if n.startswith('media') and n not in keep]
+        for name in removed:
+            self.remove_source(name)
+        for name, vol in volumes.items():
+            vol = max(0.0, min(1.0, float(vol)))
+            if self._applied_mix.get(name) == vol:
+                continue
+            info = self._inputs.get(name)
+            volume_el: Optional[Gst.Element] = info.get('volume') if info else None
+            if volume_el is None:
+                continue
+            if vol > 0.0:
+                volume_el.set_property('volume', vol)
+            volume_el.set_property('mute', vol == 0.0)
+            self._applied_mix[name] = vol
+        return removed
+
+    def apply_routing(self, active: str, stype: str, media_files: Dict[str, str],
+                      muted: Dict[str, bool], master_muted: bool = False) -> List[str]:
+        """Make ``active`` the only audible source in one batch.
+
+        Adds the active source if missing (an auto source for ``stype == 'input'``, the file from
+        media_files for ``'media'``), drops every other media source and mutes every other input
+        still present, not just the previously active one. ``active`` is unmuted unless
+        ``master_muted`` or ``muted[active]`` is set. Returns the names present afterwards; if
+        ``active`` could not be added it is missing from that list and nothing is audible.
+        """
+        self.begin_update()
+        try:
+            if active not in self._inputs:
+                # A failed add still lets the mix below apply
+                try:
+                    if stype == 'input':
+                        self.add_auto_source(active)
+                    elif stype == 'media' and media_files.get(active):
+                        self.add_media_file_source(active, media_files[active])
+                except Exception as e:
+                    print(f"[AudioCompositor] Could not add {active}: {e}")
+            volumes = dict.fromkeys(self._inputs, 0.0)
+            volumes[active] = 0.0 if master_muted or muted.get(active, False) else 1.0
+            self.apply_mix_state(volumes, present_media=(active,) if stype == 'media' else ())
+        finally:
+            self.commit_update()
+        return list(self._inputs)
+
     def set_master_volume(self, volume: float) -> None:
         """Set master volume [0.0 - 1.0]"""
         if not self._master_volume:
@@ -331,6 +417,7 @@ class AudioCompositor:
 
     def set_input_muted(self, name: str, muted: bool) -> None:
         """Toggle per-input mute for instant audio cut/enable."""
+        self._applied_mix.pop(name, None)
         info = self._inputs.get(name)
         if not info:
             return
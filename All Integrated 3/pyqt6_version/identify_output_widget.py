@@ -4,9 +4,15 @@ Identify the exact output widget and test effect application
 """
 
 import sys
+import weakref
+from functools import partial
+from PyQt6 import sip
 from PyQt6.QtWidgets import QApplication, QWidget, QFrame, QLabel
-from PyQt6.QtCore import QTimer, Qt
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import QSignalBlocker, QTimer, Qt
+from PyQt6.QtGui import QPixmapCache
+
+# Enum members resolved once rather than per call
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
 
 def identify_and_test_output():
     """Identify the output widget and test effect application"""
@@ -19,6 +25,9 @@ def identify_and_test_output():
         if app is None:
             app = QApplication(sys.argv)
         
+        from graphics_output_widget import EFFECT_PIXMAP_CACHE_KB, load_effect_pixmap
+        QPixmapCache.setCacheLimit(EFFECT_PIXMAP_CACHE_KB)
+        
         from mainwindow import MainWindow
         window = MainWindow()
         
@@ -54,6 +63,23 @@ def identify_and_test_output():
         
         print("\\n📋 Step 2: Testing effect application on the largest frame...")
         
+        # Weak references to every overlay we create, so clearing never has to
+        # walk the frame's child tree (and never touches already-deleted objects)
+        overlays = []
+        
+        def remove_test_object(attr, label):
+            """Hide and delete a test object stored on the window under ``attr``"""
+            # The window (and with it the object) may already be destroyed by Qt
+            if sip.isdeleted(window):
+                return
+            obj = getattr(window, attr, None)
+            if obj is None or sip.isdeleted(obj):
+                return
+            obj.hide()
+            obj.deleteLater()
+            delattr(window, attr)
+            print(f"  🗑️ Test {label} removed")
+        
         if largest_frame:
             # Find a test effect
             from pathlib import Path
@@ -87,40 +113,36 @@ def identify_and_test_output():
                 # Method 2: Try direct pixmap overlay
                 print("\\n🧪 Test 2: Direct pixmap overlay...")
                 try:
-                    # Create a label overlay
-                    overlay_label = QLabel(largest_frame)
-                    pixmap = QPixmap(test_effect)
+                    # Suspend repaints on the frame while the overlay is configured
+                    largest_frame.setUpdatesEnabled(False)
+                    try:
+                        # Create a label overlay
+                        overlay_label = QLabel(largest_frame)
+                        pixmap = load_effect_pixmap(test_effect)
+                        if not pixmap.isNull():
+                            with QSignalBlocker(overlay_label):
+                                # Let the label scale the pixmap at paint time to its
+                                # current size instead of allocating a pre-scaled copy
+                                overlay_label.setPixmap(pixmap)
+                                overlay_label.setScaledContents(True)
+                                overlay_label.setAlignment(_ALIGN_CENTER)
+                                overlay_label.resize(largest_frame.size())
+                                overlay_label.move(0, 0)
+                                overlay_label.show()
+                                overlay_label.raise_()
+                    finally:
+                        largest_frame.setUpdatesEnabled(True)
+                        largest_frame.update()
+                    
                     if not pixmap.isNull():
-                        # Scale pixmap to frame size
-                        scaled_pixmap = pixmap.scaled(
-                            largest_frame.size(),
-                            Qt.AspectRatioMode.KeepAspectRatio,
-                            Qt.TransformationMode.SmoothTransformation
-                        )
-                        overlay_label.setPixmap(scaled_pixmap)
-                        overlay_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                        overlay_label.resize(largest_frame.size())
-                        overlay_label.move(0, 0)
-                        overlay_label.show()
-                        overlay_label.raise_()
-                        
                         print("  ✅ Direct overlay applied successfully!")
                         
                         # Store reference for later removal
                         window._test_overlay = overlay_label
+                        overlays.append(weakref.ref(overlay_label))
                         
                         # Schedule removal after 3 seconds
-                        def remove_overlay():
-                            try:
-                                if hasattr(window, '_test_overlay'):
-                                    window._test_overlay.hide()
-                                    window._test_overlay.deleteLater()
-                                    delattr(window, '_test_overlay')
-                                    print("  🗑️ Test overlay removed")
-                            except Exception as e:
-                                print(f"  ⚠️ Error removing overlay: {e}")
-                        
-                        QTimer.singleShot(3000, remove_overlay)
+                        QTimer.singleShot(3000, partial(remove_test_object, '_test_overlay', 'overlay'))
                         
                     else:
                         print("  ❌ Failed to load pixmap")
@@ -132,30 +154,26 @@ def identify_and_test_output():
                 try:
                     from composite_output_widget import CompositeOutputWidget
                     
-                    # Create a composite widget
-                    composite = CompositeOutputWidget(largest_frame)
-                    composite.resize(largest_frame.size())
-                    composite.move(0, 0)
-                    composite.set_effect_overlay(test_effect)
-                    composite.show()
-                    composite.raise_()
+                    # Create a composite widget with frame repaints suspended
+                    largest_frame.setUpdatesEnabled(False)
+                    try:
+                        composite = CompositeOutputWidget(largest_frame)
+                        composite.resize(largest_frame.size())
+                        composite.move(0, 0)
+                        composite.set_effect_overlay(test_effect)
+                        composite.show()
+                        composite.raise_()
+                    finally:
+                        largest_frame.setUpdatesEnabled(True)
+                        largest_frame.update()
                     
                     print("  ✅ Composite widget overlay applied!")
                     
                     # Store reference and schedule removal
                     window._test_composite = composite
+                    overlays.append(weakref.ref(composite))
                     
-                    def remove_composite():
-                        try:
-                            if hasattr(window, '_test_composite'):
-                                window._test_composite.hide()
-                                window._test_composite.deleteLater()
-                                delattr(window, '_test_composite')
-                                print("  🗑️ Test composite removed")
-                        except Exception as e:
-                            print(f"  ⚠️ Error removing composite: {e}")
-                    
-                    QTimer.singleShot(6000, remove_composite)
+                    QTimer.singleShot(6000, partial(remove_test_object, '_test_composite', 'composite'))
                     
                 except Exception as e:
                     print(f"  ❌ Composite widget failed: {e}")
@@ -170,16 +188,22 @@ def identify_and_test_output():
             try:
                 print("🧹 MANUAL EFFECT CLEARING...")
                 
-                # Method 1: Remove any overlay labels
-                overlay_labels = largest_frame.findChildren(QLabel)
+                # Method 1: Remove tracked overlays (one repaint for the whole batch)
                 removed_count = 0
-                for label in overlay_labels:
-                    if label.pixmap() and not label.pixmap().isNull():
-                        label.hide()
-                        label.deleteLater()
+                largest_frame.setUpdatesEnabled(False)
+                try:
+                    for ref in overlays:
+                        overlay = ref()
+                        if overlay is None or sip.isdeleted(overlay):
+                            continue
+                        overlay.hide()
+                        overlay.deleteLater()
                         removed_count += 1
+                    overlays.clear()
+                finally:
+                    largest_frame.setUpdatesEnabled(True)
                 
-                print(f"  Removed {removed_count} overlay labels")
+                print(f"  Removed {removed_count} overlays")
                 
                 # Method 2: Clear through effects manager
                 if hasattr(window, 'on_effect_removed'):
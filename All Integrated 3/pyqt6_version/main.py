@@ -6,16 +6,22 @@ Loads and displays the original Qt Designer UI with video source selection funct
     
 import sys
 import os
+import logging
+from dataclasses import dataclass
+from functools import partial
+from types import MappingProxyType
+from typing import Optional
 from pathlib import Path
-from PyQt6 import uic, QtGui
-from PyQt6.QtCore import (QCoreApplication, QDateTime, QEvent, QObject, QPoint, QPointF, QRectF, QSize, QSettings, Qt, QTimer, pyqtSignal)
-from PyQt6.QtWidgets import QApplication, QLabel, QWidget, QMessageBox, QSizePolicy
-from PyQt6.QtMultimedia import QCamera, QMediaCaptureSession, QMediaPlayer, QAudioOutput, QVideoSink, QVideoFrame
+import numpy as np
+from PyQt6 import sip, uic, QtGui
+from PyQt6.QtCore import (QCoreApplication, QDateTime, QEvent, QObject, QPoint, QPointF, QRectF, QRunnable, QSignalBlocker, QSettings, Qt, QThreadPool, QTimer, QUrl, pyqtSignal)
+from PyQt6.QtWidgets import QAbstractButton, QApplication, QLabel, QMessageBox, QSizePolicy, QSlider, QVBoxLayout
+from PyQt6.QtMultimedia import QCamera, QCameraDevice, QMediaCaptureSession, QMediaPlayer, QAudioOutput, QVideoSink, QVideoFrame
 from PyQt6.QtMultimediaWidgets import QVideoWidget
 from video_source_dialog import VideoSourceDialog
 from media_file_dialog import MediaFileDialog
 from effects_manager import EffectsManager
-from graphics_output_widget import GraphicsOutputManager, preanalyze_effects_folder
+from graphics_output_widget import EFFECT_PIXMAP_CACHE_KB, GraphicsOutputManager, preanalyze_effects_folder
 from hdmi_stream_manager import get_hdmi_stream_manager
 # Try GStreamer first, fall back to our working stream manager
 try:
@@ -59,6 +65,14 @@ else:
             pass
         def remove_source(self, name):
             pass
+        def begin_update(self):
+            pass
+        def commit_update(self):
+            pass
+        def apply_mix_state(self, volumes, present_media=()):
+            return []
+        def apply_routing(self, active, stype, media_files, muted, master_muted=False):
+            return []
     
     class RecordingManager:
         def __init__(self, audio_channel=None):
@@ -94,59 +108,297 @@ else:
 
 from recording_settings_dialog import RecordingSettingsDialog
 
+log = logging.getLogger(__name__)
+
+# Bundled icons folder
+_ICON_DIR = Path(__file__).resolve().parent / "icons"
+
+# Preview backgrounds for every QVideoWidget under the window
+_VIDEO_WIDGET_QSS = """
+QVideoWidget { background-color: black; }
+"""
+# Square play/pause buttons for the media panels (applied once on the main window);
+# QSS sizes the content rect, so 18px + 2px padding + 1px border gives 24x24 buttons
+_MEDIA_BTN_QSS = """
+QPushButton#pushButton_19, QPushButton#pushButton_20, QPushButton#pushButton_21 {
+    min-width: 18px; max-width: 18px;
+    min-height: 18px; max-height: 18px;
+    background-color: #404040;
+    border: 1px solid #555555;
+    border-radius: 4px;
+    padding: 2px;
+    qproperty-iconSize: 16px 16px;
+}
+QPushButton#pushButton_19:hover, QPushButton#pushButton_20:hover, QPushButton#pushButton_21:hover {
+    background-color: #505050;
+    border: 1px solid #666666;
+}
+QPushButton#pushButton_19:pressed, QPushButton#pushButton_20:pressed, QPushButton#pushButton_21:pressed {
+    background-color: #353535;
+    border: 1px solid #444444;
+}
+QPushButton#pushButton_19:checked, QPushButton#pushButton_20:checked, QPushButton#pushButton_21:checked {
+    background-color: #0078d4;
+    border: 1px solid #106ebe;
+}
+"""
+# Blinking recording status dot, on and off phases
+_REC_ON_CSS = "background-color: #ff3b30; border-radius: 6px;"
+_REC_OFF_CSS = "background-color: #551111; border-radius: 6px;"
+
+# Enum members resolved once rather than per widget setup
+_KEEP_ASPECT = Qt.AspectRatioMode.KeepAspectRatio
+_PLAYING = QMediaPlayer.PlaybackState.PlayingState
+# Media statuses in which play() starts without a visible buffering stall
+_MEDIA_PLAYABLE = frozenset((
+    QMediaPlayer.MediaStatus.LoadedMedia,
+    QMediaPlayer.MediaStatus.BufferedMedia,
+    QMediaPlayer.MediaStatus.EndOfMedia,
+))
+
+# Bit position of each logical source in VideoInputManager._ac_present_mask
+_SOURCE_BITS = MappingProxyType({'input1': 0, 'input2': 1, 'input3': 2, 'media1': 3, 'media2': 4, 'media3': 5})
+# Media partition of that mask, so category checks need no name prefix tests
+_MEDIA_MASK = 0b111000
+
+# UI object names wired up by VideoInputManager (read-only)
+_INPUT_FRAMES = MappingProxyType({'input1': 'inputVideoFrame1', 'input2': 'inputVideoFrame2', 'input3': 'inputVideoFrame3'})
+_MEDIA_FRAMES = MappingProxyType({'media1': 'mediaVideoFrame1', 'media2': 'mediaVideoFrame2', 'media3': 'mediaVideoFrame3'})
+# Source name -> UI label showing what is assigned to it
+_INPUT_LABELS = MappingProxyType({'input1': 'label_input1', 'input2': 'label_input2', 'input3': 'label_input3'})
+_MEDIA_LABELS = MappingProxyType({'media1': 'label_media1', 'media2': 'label_media2', 'media3': 'label_media3'})
+_INPUT_BUTTONS = MappingProxyType({
+    'input1SettingsButton': 'input1',
+    'input2SettingsButton': 'input2',
+    'input3SettingsButton': 'input3',
+})
+_MEDIA_BUTTONS = MappingProxyType({
+    'media1SettingsButton': 'media1',
+    'media2SettingsButton': 'media2',
+    'media3SettingsButton': 'media3',
+})
+# 1A switching buttons
+_SWITCHING_BUTTONS = MappingProxyType({
+    'input1_1A_btn': ('input', 'input1'),
+    'input2_1A_btn': ('input', 'input2'),
+    'input3_1A_btn': ('input', 'input3'),
+    'media1_1A_btn': ('media', 'media1'),
+    'media2_1A_btn': ('media', 'media2'),
+    'media3_1A_btn': ('media', 'media3'),
+})
+_AUDIO_BUTTONS = MappingProxyType({
+    'input1AudioButton': ('input', 'input1'),
+    'input2AudioButton': ('input', 'input2'),
+    'input3AudioButton': ('input', 'input3'),
+    'media1AudioButton': ('media', 'media1'),
+    'media2AudioButton': ('media', 'media2'),
+    'media3AudioButton': ('media', 'media3'),
+})
+# Icons applied to the main window's buttons at startup: (objectName, icon file)
+_ICON_TABLE = (
+    ('audioTopButton', 'Volume.png'),
+    # Record panel
+    ('settingsRecordButton', 'Settings.png'),
+    ('recordRedCircle', 'Record.png'),
+    ('playButton', 'Play.png'),
+    ('captureButton', 'capture.png'),
+    # Stream panel
+    ('stream1SettingsBtn', 'Settings.png'),
+    ('stream1AudioBtn', 'Stream.png'),
+    ('stream2SettingsBtn', 'Settings.png'),
+    ('stream2AudioBtn', 'Stream.png'),
+    # Input and media panels
+    ('input1SettingsButton', 'Settings.png'),
+    ('input2SettingsButton', 'Settings.png'),
+    ('input3SettingsButton', 'Settings.png'),
+    ('media1SettingsButton', 'Settings.png'),
+    ('media2SettingsButton', 'Settings.png'),
+    ('media3SettingsButton', 'Settings.png'),
+)
+# Media play/pause buttons and progress sliders, keyed by media name
+_MEDIA_CONTROL_BUTTONS = MappingProxyType({'media1': 'pushButton_19', 'media2': 'pushButton_20', 'media3': 'pushButton_21'})
+_MEDIA_SLIDERS = MappingProxyType({'media1': 'horizontalSlider', 'media2': 'horizontalSlider_2', 'media3': 'horizontalSlider_3'})
+
+
+def _format_table(formats):
+    """Return (width, height, fps) float arrays for a list of QCameraFormat, read in one pass"""
+    table = np.empty((3, len(formats)), dtype=np.float64)
+    for i, fmt in enumerate(formats):
+        sz = fmt.resolution()
+        table[:, i] = (sz.width(), sz.height(), fmt.maxFrameRate())
+    return table
+
+
+class _IconCache:
+    """Process-wide QIcons from the icons folder; each file is loaded once and shared"""
+    _icons = {}
+
+    @classmethod
+    def get(cls, name):
+        icon = cls._icons.get(name)
+        if icon is None:
+            icon = QtGui.QIcon(str(_ICON_DIR / name))
+            cls._icons[name] = icon
+        return icon
+
+    @classmethod
+    def volume(cls):
+        return cls.get("Volume.png")
+
+    @classmethod
+    def mute(cls):
+        return cls.get("Mute.png")
+
+    @classmethod
+    def play(cls):
+        return cls.get("Play.png")
+
+    @classmethod
+    def pause(cls):
+        return cls.get("Pause.png")
+
+
+@dataclass
+class InputSlot:
+    """Everything VideoInputManager tracks for one camera input"""
+    name: str
+    source: Optional[QCameraDevice] = None
+    camera: Optional[QCamera] = None
+    session: Optional[QMediaCaptureSession] = None
+    widget: Optional[QVideoWidget] = None
+
+
+@dataclass
+class MediaSlot:
+    """Everything VideoInputManager tracks for one media file input"""
+    name: str
+    file: Optional[str] = None
+    player: Optional[QMediaPlayer] = None
+    widget: Optional[QVideoWidget] = None
+
+
+class _VisibilityWatcher(QObject):
+    """Event filter reporting Show/Hide of watched widgets to a callback(widget, visible)"""
+
+    def __init__(self, callback, parent=None):
+        super().__init__(parent)
+        self._callback = callback
+
+    def eventFilter(self, obj, event):
+        etype = event.type()
+        if etype == QEvent.Type.Show:
+            self._callback(obj, True)
+        elif etype == QEvent.Type.Hide:
+            self._callback(obj, False)
+        return False
+
+
+class _SaveImage(QRunnable):
+    """Encode and write a QImage on a thread pool worker, off the GUI thread"""
+
+    def __init__(self, image, path, fmt, quality=-1):
+        super().__init__()
+        self._image = image
+        self._path = path
+        self._fmt = fmt
+        self._quality = quality
+
+    def run(self):
+        if self._image.save(self._path, self._fmt, self._quality):
+            # WARNING so the confirmation shows at main()'s default log level
+            log.warning("Screenshot saved to %s", self._path)
+        else:
+            log.warning("Failed saving screenshot to %s", self._path)
+
+
+class _TaskSignals(QObject):
+    """Completion signal for a QRunnable; receivers on the GUI thread get it queued"""
+    finished = pyqtSignal()
+
+
+class _EffectsPreanalysis(QRunnable):
+    """Run preanalyze_effects_folder on a thread pool worker, then emit signals.finished"""
+
+    def __init__(self, folder, signals):
+        super().__init__()
+        self._folder = folder
+        self.signals = signals
+
+    def run(self):
+        try:
+            preanalyze_effects_folder(self._folder)
+        except Exception as e:
+            log.warning("Error pre-analyzing effects: %s", e)
+        self.signals.finished.emit()
 
 
 class VideoInputManager:
+    # Camera device id -> list of QCameraFormat (videoFormats() can be slow on some backends)
+    _formats_cache = {}
+    # Camera device id -> highest-scoring QCameraFormat picked from _formats_cache
+    _best_format_cache = {}
+    # Camera device id -> description() string, for labels and log lines
+    _device_desc_cache = {}
+
     def __init__(self, window):
         self.window = window
-        self.input_sources = {
-            'input1': None,
-            'input2': None,
-            'input3': None
-        }
-        self.input_cameras = {
-            'input1': None,
-            'input2': None,
-            'input3': None
-        }
-        self.input_sessions = {
-            'input1': None,
-            'input2': None,
-            'input3': None
-        }
-        self.input_widgets = {
-            'input1': None,
-            'input2': None,
-            'input3': None
-        }
-        # Note: Using QVideoWidget directly (QVideoSink is not available on this build)
-        # Media file management
-        self.media_files = {
+        # (buttons, sliders) by objectName, collected on first use (see _ui_controls)
+        self._controls = None
+        # Slider drag seeks, coalesced to at most one per media every 50 ms (each seek is a demuxer keyframe re-sync)
+        self._slider_pending = {}
+        # Progress value last written to each media slider by update_media_progress
+        self._last_progress = {}
+        # Playing state last shown on each media play/pause button
+        self._last_play_state = {}
+        self._slider_timer = QTimer()
+        self._slider_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._slider_timer.setInterval(50)
+        self._slider_timer.setSingleShot(True)
+        self._slider_timer.timeout.connect(self._flush_slider)
+        # Per-source state, one slot object per input / media name
+        self.inputs = {name: InputSlot(name) for name in ('input1', 'input2', 'input3')}
+        self.media = {name: MediaSlot(name) for name in ('media1', 'media2', 'media3')}
+        # Last QMediaPlayer.MediaStatus reported per media (pushed by mediaStatusChanged)
+        self.media_status = {
             'media1': None,
             'media2': None,
             'media3': None
         }
-        self.media_players = {
-            'media1': None,
-            'media2': None,
-            'media3': None
-        }
-        # Per-media audio outputs (Qt6 requires QAudioOutput to hear media audio)
-        self.media_audio_outputs = {
-            'media1': None,
-            'media2': None,
-            'media3': None
-        }
-        self.media_widgets = {
-            'media1': None,
-            'media2': None,
-            'media3': None
+        # Media taken to output before their player finished loading; played once it has
+        self._play_when_ready = set()
+        # Newly selected media whose decoders get a short silent warm-up play once loaded
+        self._prime_pending = set()
+        # Media currently in that warm-up play; a user play/pause or take to output ends the claim
+        self._priming = set()
+        # Text last written to each source label, to skip no-op setText calls
+        self._last_label_text = {}
+        # Source name labels, resolved once
+        self._labels = {
+            name: getattr(self.window, label_name, None)
+            for label_map in (_INPUT_LABELS, _MEDIA_LABELS)
+            for name, label_name in label_map.items()
         }
+        # UI frames hosting the lazily created input/media video widgets
+        self._input_frames = {}
+        # Input name -> preview widget detached from its session while hidden
+        self._paused_outputs = {}
+        self._visibility_watcher = _VisibilityWatcher(self._on_input_visibility)
+        self._media_frames = {}
         # Output preview management
         self.current_output_source = None
         self.output_preview_widget = None  # Will be set to composite widget's internal video widget
-        # Shared QVideoSink for routing camera frames into the graphics scene
+        # Session or player currently feeding the output (so clearing needn't scan them all)
+        self._current_output_producer = None
+        # Bumped on every switch so stale deferred switch work can bail out
+        self._switch_epoch = 0
+        # Shared QVideoSink for outputs that only take QImages (see qvideosink); its frames
+        # reach _on_sink_frame only while a camera is routed through it
         self._qvideosink = None
+        self._sink_connected = False
+        # Output's set_qimage_frame, looked up once per output rather than per frame
+        self._preview_sink_slot = None
+        # True once the output is a video item that sessions can render into directly
+        self._output_accepts_video = False
         
         # --- Audio mute state ---
         self.muted_inputs = {
@@ -162,20 +414,36 @@ class VideoInputManager:
         # Audio compositor reference (set from main)
         self.audio_compositor = None
         # Track which logical sources are currently present inside AudioCompositor
-        # to avoid redundant add/remove (which spams pad-added and rebuilds decodebins)
-        self._ac_present_sources = set()
+        # to avoid redundant add/remove (which spams pad-added and rebuilds decodebins).
+        # Bit i is set iff the source with _SOURCE_BITS index i is registered.
+        self._ac_present_mask = 0
         # Track currently active audible logical source to avoid touching all sources on switch
         self._active_audio_name = None
-
-        # Icon paths for toggling (fallback when UI doesn't auto-toggle)
-        try:
-            icons_dir = Path(__file__).resolve().parent / "icons"
-            self._icon_volume = QtGui.QIcon(str(icons_dir / "Volume.png"))
-            self._icon_mute = QtGui.QIcon(str(icons_dir / "Mute.png"))
-        except Exception:
-            self._icon_volume = QtGui.QIcon()
-            self._icon_mute = QtGui.QIcon()
-
+        # Last mute states written to AudioCompositor, so repeated writes can be skipped
+        self._last_applied_mute = {}
+        self._last_applied_master = None
+        # Qt6 needs a QAudioOutput to hear media audio; only one media is audible at a time,
+        # so a single output is created on first use and moved onto the audible player
+        self._shared_audio_output = None
+        self._audio_output_owner = None
+
+        # Icons for toggling (fallback when UI doesn't auto-toggle)
+        self._icon_volume = _IconCache.volume()
+        self._icon_mute = _IconCache.mute()
+
+        # Mute buttons resolved once; handlers update their icons without window lookups
+        buttons, sliders = self._ui_controls()
+        self._btn_master = next(
+            (buttons[n] for n in ("masterMuteButton", "master_mute_btn", "outputMasterMuteButton") if n in buttons),
+            None
+        )
+        self._btn_audio_top = buttons.get('audioTopButton')
+        self._btn_mute = {name: buttons.get(f'{name}AudioButton') for name in (*self.inputs, *self.media)}
+        # Play/pause buttons and progress sliders per media, for the playback/progress handlers
+        self._btn_play = {name: buttons.get(btn_name) for name, btn_name in _MEDIA_CONTROL_BUTTONS.items()}
+        self._media_sliders = {name: sliders.get(sl_name) for name, sl_name in _MEDIA_SLIDERS.items()}
+        # Video widget and media button styling, parsed once on the window
+        self.window.setStyleSheet(self.window.styleSheet() + _VIDEO_WIDGET_QSS + _MEDIA_BTN_QSS)
         self.setup_input_widgets()
         # Connect output panel (monitor) mute button
         self._connect_output_panel_audio_button()
@@ -183,14 +451,6 @@ class VideoInputManager:
         # setup_output_preview() is now handled in main function with graphics widget
         self.connect_buttons()
         self.connect_audio_buttons()
-        # Initialize QVideoSink if available and connect frame signal
-        try:
-            self._qvideosink = QVideoSink()
-            # Forward frames from sink to the graphics video item as QImage
-            self._qvideosink.videoFrameChanged.connect(self._on_sink_frame)
-        except Exception as e:
-            print(f"Warning: QVideoSink not available or failed to initialize: {e}")
-            self._qvideosink = None
         # Streaming handoff state
         self.stream_manager = None  # type: ignore
         self._media_streamers = {}  # stream_name -> GstMediaRtmpStreamer
@@ -205,131 +465,161 @@ class VideoInputManager:
         }
         
     def setup_input_widgets(self):
-        """Setup video widgets for each input"""
-        # Create video widgets and add them to the input frames
-        frame_mappings = {
-            'input1': 'inputVideoFrame1',
-            'input2': 'inputVideoFrame2', 
-            'input3': 'inputVideoFrame3'
-        }
-        
-        for input_name, frame_name in frame_mappings.items():
+        """Prepare input frames; video widgets and sessions are created on first use"""
+        for input_name, frame_name in _INPUT_FRAMES.items():
             try:
                 if hasattr(self.window, frame_name):
                     frame = getattr(self.window, frame_name)
                     
                     if not frame:
-                        print(f"Error: Frame {frame_name} is None")
+                        log.warning("Frame %s is None", frame_name)
                         continue
                     
                     # Override frame size policy to allow expansion
-                    from PyQt6.QtWidgets import QSizePolicy
                     frame.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
                     frame.setMinimumSize(160, 90)  # Minimum 16:9 size
                     
-                    # Create video widget
-                    video_widget = QVideoWidget()
-                    video_widget.setStyleSheet("background-color: black;")
-                    # Keep original aspect ratio, show full input without cropping
-                    try:
-                        video_widget.setAspectRatioMode(Qt.AspectRatioMode.KeepAspectRatio)
-                    except Exception:
-                        pass
-                    
-                    # Set size policy to expand and fill available space
-                    video_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-                    
-                    # Add to frame layout directly
-                    if frame.layout() is None:
-                        from PyQt6.QtWidgets import QVBoxLayout
-                        layout = QVBoxLayout(frame)
-                        layout.setContentsMargins(0, 0, 0, 0)
-                        layout.setSpacing(0)
-                    else:
-                        layout = frame.layout()
-                    
-                    # Add video widget directly to show full input
-                    layout.addWidget(video_widget)
-                    self.input_widgets[input_name] = video_widget
-                    
-                    # Create capture session and connect to the widget directly
-                    session = QMediaCaptureSession()
-                    session.setVideoOutput(video_widget)
-                    self.input_sessions[input_name] = session
+                    # Video widget + capture session are built in _ensure_input_widget
+                    self._input_frames[input_name] = frame
                 else:
-                    print(f"Warning: Frame {frame_name} not found in UI")
+                    log.warning("Frame %s not found in UI", frame_name)
             except Exception as e:
-                print(f"Error setting up input widget {input_name}: {e}")
+                log.warning("Error setting up input widget %s: %s", input_name, e)
     
-    def setup_media_widgets(self):
-        """Setup video widgets for each media input"""
-        frame_mappings = {
-            'media1': 'mediaVideoFrame1',
-            'media2': 'mediaVideoFrame2', 
-            'media3': 'mediaVideoFrame3'
-        }
+    def _ensure_input_widget(self, input_name):
+        """Create the video widget and capture session for an input on first use.
+
+        Returns a ``(video_widget, session)`` tuple, or ``(None, None)`` when the
+        input has no frame in the UI.
+        """
+        slot = self.inputs.get(input_name)
+        if slot is None:
+            return None, None
+        if slot.widget is not None:
+            return slot.widget, slot.session
+        
+        frame = self._input_frames.get(input_name)
+        if frame is None:
+            return None, None
         
-        for media_name, frame_name in frame_mappings.items():
+        # Create video widget
+        video_widget = QVideoWidget()
+        # Keep original aspect ratio, show full input without cropping
+        try:
+            video_widget.setAspectRatioMode(_KEEP_ASPECT)
+        except Exception:
+            pass
+        
+        # Set size policy to expand and fill available space
+        video_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        
+        # Add to frame layout directly; one repaint once the widget is in place
+        frame.setUpdatesEnabled(False)
+        try:
+            if frame.layout() is None:
+                layout = QVBoxLayout(frame)
+                layout.setContentsMargins(0, 0, 0, 0)
+                layout.setSpacing(0)
+            else:
+                layout = frame.layout()
+            
+            # Add video widget directly to show full input
+            layout.addWidget(video_widget)
+        finally:
+            frame.setUpdatesEnabled(True)
+        slot.widget = video_widget
+        # Forget the widget as soon as Qt destroys it (e.g. with its parent frame)
+        video_widget.destroyed.connect(partial(self._on_widget_destroyed, slot))
+        # Stop feeding frames to the preview while it is hidden
+        video_widget.setProperty('inputName', input_name)
+        video_widget.installEventFilter(self._visibility_watcher)
+        
+        # Create capture session and connect to the widget directly
+        session = QMediaCaptureSession()
+        session.setVideoOutput(video_widget)
+        slot.session = session
+        return video_widget, session
+    
+    def _on_widget_destroyed(self, slot, *_):
+        """Drop the reference to a slot's video widget once Qt has deleted it"""
+        slot.widget = None
+        self._paused_outputs.pop(slot.name, None)
+
+    def _on_input_visibility(self, video_widget, visible):
+        """Detach a hidden input preview from its session and reattach it when shown"""
+        input_name = video_widget.property('inputName')
+        slot = self.inputs.get(input_name)
+        session = slot.session if slot else None
+        if session is None:
+            return
+        if visible:
+            # Restore only if the session was not routed elsewhere (e.g. to the output) meanwhile
+            if self._paused_outputs.pop(input_name, None) is video_widget and session.videoOutput() is None:
+                session.setVideoOutput(video_widget)
+        elif session.videoOutput() is video_widget:
+            session.setVideoOutput(None)
+            self._paused_outputs[input_name] = video_widget
+
+    def setup_media_widgets(self):
+        """Prepare media frames; video widgets are created when a file is assigned"""
+        for media_name, frame_name in _MEDIA_FRAMES.items():
             try:
                 if hasattr(self.window, frame_name):
                     frame = getattr(self.window, frame_name)
                     
                     if not frame:
-                        print(f"Error: Frame {frame_name} is None")
+                        log.warning("Frame %s is None", frame_name)
                         continue
                     
-                    # Create video widget
-                    video_widget = QVideoWidget()
-                    video_widget.setStyleSheet("background-color: black;")
-                    
-                    # Add to frame layout
-                    if frame.layout() is None:
-                        from PyQt6.QtWidgets import QVBoxLayout
-                        layout = QVBoxLayout(frame)
-                        layout.setContentsMargins(2, 2, 2, 2)
-                    else:
-                        layout = frame.layout()
-                    
-                    layout.addWidget(video_widget)
-                    self.media_widgets[media_name] = video_widget
-                    
-                    # Create media player with ENHANCED QUALITY settings
-                    player = QMediaPlayer()
-                    
-                    # QUALITY ENHANCEMENT: Set high-quality audio output
-                    audio_output = QAudioOutput()
-                    # Set high-quality audio settings
-                    try:
-                        # Enable high-quality audio processing
-                        audio_output.setVolume(1.0)  # Full volume for quality
-                        player.setAudioOutput(audio_output)
-                        self.media_audio_outputs[media_name] = audio_output
-                        print(f"✅ High-quality audio output configured for {media_name}")
-                    except Exception as e:
-                        print(f"Could not configure audio output for {media_name}: {e}")
-                    
-                    # Connect to video widget with quality settings
-                    player.setVideoOutput(video_widget)
-                    
-                    # QUALITY ENHANCEMENT: Configure video widget for maximum quality
-                    try:
-                        video_widget.setAspectRatioMode(Qt.AspectRatioMode.KeepAspectRatio)
-                        # Enable high-quality scaling
-                        video_widget.setSizePolicy(
-                            QSizePolicy.Policy.Expanding, 
-                            QSizePolicy.Policy.Expanding
-                        )
-                        print(f"✅ High-quality video settings applied to {media_name}")
-                    except Exception as e:
-                        print(f"Could not apply video quality settings to {media_name}: {e}")
-                    
-                    self.media_players[media_name] = player
-                    
-                    print(f"Media widget {media_name} setup complete")
+                    # Video widget is built in _ensure_media_widget, player in set_media_file
+                    self._media_frames[media_name] = frame
                 else:
-                    print(f"Warning: Frame {frame_name} not found in UI")
+                    log.warning("Frame %s not found in UI", frame_name)
             except Exception as e:
-                print(f"Error setting up media widget {media_name}: {e}")
+                log.warning("Error setting up media widget %s: %s", media_name, e)
+    
+    def _ensure_media_widget(self, media_name):
+        """Create the video widget for a media slot on first use"""
+        slot = self.media.get(media_name)
+        if slot is None:
+            return None
+        if slot.widget is not None:
+            return slot.widget
+        
+        frame = self._media_frames.get(media_name)
+        if frame is None:
+            return None
+        
+        # Create video widget
+        video_widget = QVideoWidget()
+        
+        # Add to frame layout; one repaint once the widget is in place
+        frame.setUpdatesEnabled(False)
+        try:
+            if frame.layout() is None:
+                layout = QVBoxLayout(frame)
+                layout.setContentsMargins(2, 2, 2, 2)
+            else:
+                layout = frame.layout()
+            
+            layout.addWidget(video_widget)
+        finally:
+            frame.setUpdatesEnabled(True)
+        slot.widget = video_widget
+        video_widget.destroyed.connect(partial(self._on_widget_destroyed, slot))
+        
+        # QUALITY ENHANCEMENT: Configure video widget for maximum quality
+        try:
+            video_widget.setAspectRatioMode(_KEEP_ASPECT)
+            # Enable high-quality scaling
+            video_widget.setSizePolicy(
+                QSizePolicy.Policy.Expanding, 
+                QSizePolicy.Policy.Expanding
+            )
+        except Exception as e:
+            log.warning("Could not apply video quality settings to %s: %s", media_name, e)
+        
+        return video_widget
     
     def setup_output_preview(self):
         """Setup the main output preview widget"""
@@ -342,174 +632,113 @@ class VideoInputManager:
             
             # Add to output frame layout
             if output_frame.layout() is None:
-                from PyQt6.QtWidgets import QVBoxLayout
                 layout = QVBoxLayout(output_frame)
                 layout.setContentsMargins(0, 0, 0, 0)
             else:
                 layout = output_frame.layout()
             
             layout.addWidget(self.output_preview_widget)
+            self._bind_output_preview()
         else:
-            print("Warning: outputPreview frame not found in UI")
+            log.warning("outputPreview frame not found in UI")
         
+    def _ui_controls(self):
+        """Return ``(buttons, sliders)`` dicts of the UI's controls keyed by objectName.
+        Built with one findChildren pass per type instead of probing the window per name.
+        """
+        if self._controls is None:
+            self._controls = (
+                {b.objectName(): b for b in self.window.findChildren(QAbstractButton)},
+                {s.objectName(): s for s in self.window.findChildren(QSlider)},
+            )
+        return self._controls
+
     def connect_buttons(self):
         """Connect settings buttons to open dialogs"""
+        buttons, sliders = self._ui_controls()
         # Input video source buttons
-        input_button_mappings = {
-            'input1SettingsButton': 'input1',
-            'input2SettingsButton': 'input2', 
-            'input3SettingsButton': 'input3'
-        }
-        
-        for button_name, input_name in input_button_mappings.items():
+        for button_name, input_name in _INPUT_BUTTONS.items():
             try:
-                if hasattr(self.window, button_name):
-                    button = getattr(self.window, button_name)
-                    if button:
-                        button.clicked.connect(lambda checked, inp=input_name: self.open_source_dialog(inp))
-                    else:
-                        print(f"Warning: Button {button_name} is None")
-                else:
-                    print(f"Warning: Button {button_name} not found in UI")
+                button = buttons.get(button_name)
+                if button is None:
+                    log.warning("Button %s not found in UI", button_name)
+                    continue
+                button.clicked.connect(partial(self.open_source_dialog, input_name))
             except Exception as e:
-                print(f"Error connecting button {button_name}: {e}")
+                log.warning("Error connecting button %s: %s", button_name, e)
         
         # Media file buttons
-        media_button_mappings = {
-            'media1SettingsButton': 'media1',
-            'media2SettingsButton': 'media2', 
-            'media3SettingsButton': 'media3'
-        }
-        
-        for button_name, media_name in media_button_mappings.items():
+        for button_name, media_name in _MEDIA_BUTTONS.items():
             try:
-                if hasattr(self.window, button_name):
-                    button = getattr(self.window, button_name)
-                    if button:
-                        button.clicked.connect(lambda checked, med=media_name: self.open_media_dialog(med))
-                    else:
-                        print(f"Warning: Button {button_name} is None")
-                else:
-                    print(f"Warning: Button {button_name} not found in UI")
+                button = buttons.get(button_name)
+                if button is None:
+                    log.warning("Button %s not found in UI", button_name)
+                    continue
+                button.clicked.connect(partial(self.open_media_dialog, media_name))
             except Exception as e:
-                print(f"Error connecting button {button_name}: {e}")
+                log.warning("Error connecting button %s: %s", button_name, e)
         
         # 1A switching buttons
-        switching_button_mappings = {
-            'input1_1A_btn': ('input', 'input1'),
-            'input2_1A_btn': ('input', 'input2'),
-            'input3_1A_btn': ('input', 'input3'),
-            'media1_1A_btn': ('media', 'media1'),
-            'media2_1A_btn': ('media', 'media2'),
-            'media3_1A_btn': ('media', 'media3')
-        }
-        
-        for button_name, (source_type, source_name) in switching_button_mappings.items():
+        for button_name, (source_type, source_name) in _SWITCHING_BUTTONS.items():
             try:
-                if hasattr(self.window, button_name):
-                    button = getattr(self.window, button_name)
-                    if button:
-                        button.clicked.connect(lambda checked, st=source_type, sn=source_name: self.switch_to_output(st, sn))
-                    else:
-                        print(f"Warning: Button {button_name} is None")
-                else:
-                    print(f"Warning: Button {button_name} not found in UI")
+                button = buttons.get(button_name)
+                if button is None:
+                    log.warning("Button %s not found in UI", button_name)
+                    continue
+                button.clicked.connect(partial(self.switch_to_output, source_type, source_name))
             except Exception as e:
-                print(f"Error connecting switching button {button_name}: {e}")
+                log.warning("Error connecting switching button %s: %s", button_name, e)
 
         # Media control buttons (play/pause)
-        media_control_mappings = {
-            'pushButton_19': 'media1',
-            'pushButton_20': 'media2',
-            'pushButton_21': 'media3'
-        }
-        
-        # Load play/pause icons
-        icon_path = Path(__file__).resolve().parent / "icons"
-        play_icon = QtGui.QIcon(str(icon_path / "Play.png"))
-        pause_icon = QtGui.QIcon(str(icon_path / "Pause.png"))
+        # Shared play/pause icons
+        play_icon = _IconCache.play()
+        pause_icon = _IconCache.pause()
         
-        for button_name, media_name in media_control_mappings.items():
+        for media_name, button_name in _MEDIA_CONTROL_BUTTONS.items():
             try:
-                if hasattr(self.window, button_name):
-                    button = getattr(self.window, button_name)
-                    if button:
-                        # Make button square and set styling
-                        button.setMinimumSize(24, 24)
-                        button.setMaximumSize(24, 24)
-                        button.setStyleSheet("""
-                            QPushButton {
-                                background-color: #404040;
-                                border: 1px solid #555555;
-                                border-radius: 4px;
-                                padding: 2px;
-                            }
-                            QPushButton:hover {
-                                background-color: #505050;
-                                border: 1px solid #666666;
-                            }
-                            QPushButton:pressed {
-                                background-color: #353535;
-                                border: 1px solid #444444;
-                            }
-                            QPushButton:checked {
-                                background-color: #0078d4;
-                                border: 1px solid #106ebe;
-                            }
-                        """)
-                        
-                        # Set initial play icon
-                        button.setIcon(play_icon)
-                        button.setIconSize(button.size() * 0.7)  # Icon slightly smaller than button
+                button = buttons.get(button_name)
+                if button is None:
+                    log.warning("Media control button %s not found in UI", button_name)
+                    continue
+                # Size and styling come from _MEDIA_BTN_QSS (incl. icon size); set initial play icon
+                button.setIcon(play_icon)
                         
-                        # Make it a toggle button
-                        button.setCheckable(True)
-                        button.setChecked(False)  # Start in paused state
+                # Make it a toggle button
+                button.setCheckable(True)
+                button.setChecked(False)  # Start in paused state
                         
-                        # Store icons for later use
-                        button.play_icon = play_icon
-                        button.pause_icon = pause_icon
+                # Store icons for later use
+                button.play_icon = play_icon
+                button.pause_icon = pause_icon
                         
-                        button.clicked.connect(lambda checked, med=media_name: self.toggle_media_playback(med))
-                    else:
-                        print(f"Warning: Media control button {button_name} is None")
-                else:
-                    print(f"Warning: Media control button {button_name} not found in UI")
+                button.clicked.connect(partial(self.toggle_media_playback, media_name))
             except Exception as e:
-                print(f"Error connecting media control button {button_name}: {e}")
+                log.warning("Error connecting media control button %s: %s", button_name, e)
 
         # Media progress sliders
-        media_slider_mappings = {
-            'horizontalSlider': 'media1',
-            'horizontalSlider_2': 'media2',
-            'horizontalSlider_3': 'media3'
-        }
-        
-        for slider_name, media_name in media_slider_mappings.items():
+        for media_name, slider_name in _MEDIA_SLIDERS.items():
             try:
-                if hasattr(self.window, slider_name):
-                    slider = getattr(self.window, slider_name)
-                    if slider:
-                        slider.setMinimum(0)
-                        slider.setMaximum(1000)  # Use 1000 for smooth progress
-                        slider.setValue(0)
-                        slider.sliderPressed.connect(lambda med=media_name: self.on_slider_pressed(med))
-                        slider.sliderReleased.connect(lambda med=media_name: self.on_slider_released(med))
-                        slider.valueChanged.connect(lambda value, med=media_name: self.on_slider_value_changed(med, value))
-                    else:
-                        print(f"Warning: Media slider {slider_name} is None")
-                else:
-                    print(f"Warning: Media slider {slider_name} not found in UI")
+                slider = sliders.get(slider_name)
+                if slider is None:
+                    log.warning("Media slider %s not found in UI", slider_name)
+                    continue
+                with QSignalBlocker(slider):
+                    slider.setMinimum(0)
+                    slider.setMaximum(1000)  # Use 1000 for smooth progress
+                    slider.setValue(0)
+                slider.sliderPressed.connect(partial(self.on_slider_pressed, media_name))
+                slider.sliderReleased.connect(partial(self.on_slider_released, media_name))
+                slider.valueChanged.connect(partial(self.on_slider_value_changed, media_name))
             except Exception as e:
-                print(f"Error connecting media slider {slider_name}: {e}")
+                log.warning("Error connecting media slider %s: %s", slider_name, e)
 
     def _toggle_button_icon(self, button, muted: bool):
         """Ensure the icon reflects mute state even if the .ui iconset doesn't auto-toggle."""
+        if button is None:
+            return
         try:
-            if not isinstance(button, QWidget):
-                return
-            # If button is checkable, keep its checked state in sync
-            if hasattr(button, 'setChecked'):
+            # Keep the checked state in sync (without re-entering handlers); callers pass QAbstractButtons
+            with QSignalBlocker(button):
                 button.setChecked(muted)
             # Explicitly set icon to be safe
             button.setIcon(self._icon_mute if muted else self._icon_volume)
@@ -518,39 +747,27 @@ class VideoInputManager:
 
     def connect_audio_buttons(self):
         """Connect per-input and media audio buttons, plus optional master mute."""
-        audio_btn_map = {
-            'input1AudioButton': ('input', 'input1'),
-            'input2AudioButton': ('input', 'input2'),
-            'input3AudioButton': ('input', 'input3'),
-            'media1AudioButton': ('media', 'media1'),
-            'media2AudioButton': ('media', 'media2'),
-            'media3AudioButton': ('media', 'media3'),
-        }
-
-        for btn_name, (stype, sname) in audio_btn_map.items():
+        buttons, _ = self._ui_controls()
+        for btn_name, (stype, sname) in _AUDIO_BUTTONS.items():
             try:
-                if hasattr(self.window, btn_name):
-                    btn = getattr(self.window, btn_name)
-                    if btn:
-                        # Initialize icon to unmuted
-                        self._toggle_button_icon(btn, self.muted_inputs.get(sname, False))
-                        btn.clicked.connect(lambda checked=False, t=stype, n=sname: self.on_per_input_mute_toggle(t, n))
-                    else:
-                        print(f"Warning: Button {btn_name} is None")
-                else:
-                    print(f"Warning: Button {btn_name} not found in UI")
+                btn = buttons.get(btn_name)
+                if btn is None:
+                    log.warning("Button %s not found in UI", btn_name)
+                    continue
+                # Initialize icon to unmuted
+                self._toggle_button_icon(btn, self.muted_inputs.get(sname, False))
+                btn.clicked.connect(partial(self.on_per_input_mute_toggle, stype, sname))
             except Exception as e:
-                print(f"Error connecting audio button {btn_name}: {e}")
+                log.warning("Error connecting audio button %s: %s", btn_name, e)
 
         # Optional master mute button if present in UI later
         for master_name in ("audioTopButton", "masterMuteButton", "master_mute_btn", "outputMasterMuteButton"):
             try:
-                if hasattr(self.window, master_name):
-                    mbtn = getattr(self.window, master_name)
-                    if mbtn:
-                        self._toggle_button_icon(mbtn, self.master_muted)
-                        mbtn.clicked.connect(self.on_master_mute_toggle)
-                        break
+                mbtn = buttons.get(master_name)
+                if mbtn is not None:
+                    self._toggle_button_icon(mbtn, self.master_muted)
+                    mbtn.clicked.connect(self.on_master_mute_toggle)
+                    break
             except Exception:
                 pass
 
@@ -561,17 +778,9 @@ class VideoInputManager:
             self.muted_inputs[source_name] = new_state
 
             # Update button icon
-            btn_lookup = {
-                'input1': 'input1AudioButton',
-                'input2': 'input2AudioButton',
-                'input3': 'input3AudioButton',
-                'media1': 'media1AudioButton',
-                'media2': 'media2AudioButton',
-                'media3': 'media3AudioButton',
-            }
-            bname = btn_lookup.get(source_name)
-            if bname and hasattr(self.window, bname):
-                self._toggle_button_icon(getattr(self.window, bname), new_state)
+            btn = self._btn_mute.get(source_name)
+            if btn is not None:
+                self._toggle_button_icon(btn, new_state)
 
             # Apply immediately only if the toggled source is currently active in output
             if self.current_output_source == (source_type, source_name):
@@ -580,85 +789,110 @@ class VideoInputManager:
                     if getattr(self, 'audio_compositor', None):
                         try:
                             # Ensure source exists in AC
-                            if self.media_files.get(source_name) and source_name not in self._ac_present_sources:
-                                self.audio_compositor.add_media_file_source(source_name, self.media_files[source_name])
-                                self._ac_present_sources.add(source_name)
+                            fpath = self._media_file(source_name)
+                            if fpath and not self._ac_is_present(source_name):
+                                self.audio_compositor.add_media_file_source(source_name, fpath)
+                                self._ac_mark_present(source_name)
                         except Exception:
                             pass
                         # Mute immediately if per-source or master is muted
-                        self.audio_compositor.set_input_muted(source_name, bool(new_state or self.master_muted))
+                        self._apply_per_input_mute(source_type, source_name, new_state or self.master_muted)
                 else:
                     # Control mic mute via audio compositor for active input
                     self._apply_per_input_mute(source_type, source_name, new_state)
-            print(f"{'Muted' if new_state else 'Unmuted'} {source_name}")
         except Exception as e:
-            print(f"Error toggling mute for {source_name}: {e}")
+            log.warning("Error toggling mute for %s: %s", source_name, e)
 
     def on_master_mute_toggle(self):
         """Toggle master mute for final mixed output."""
         try:
             self.master_muted = not self.master_muted
             # Update icon if button exists
-            for master_name in ("masterMuteButton", "master_mute_btn", "outputMasterMuteButton"):
-                btn = getattr(self.window, master_name, None)
-                if btn:
-                    self._toggle_button_icon(btn, self.master_muted)
-                    break
+            if self._btn_master is not None:
+                self._toggle_button_icon(self._btn_master, self.master_muted)
 
             # Integration hook: adjust master volume when available
             self._apply_master_mute(self.master_muted)
-            print(f"Master {'muted' if self.master_muted else 'unmuted'}")
         except Exception as e:
-            print(f"Error toggling master mute: {e}")
+            log.warning("Error toggling master mute: %s", e)
 
     def _connect_output_panel_audio_button(self):
         """Connect the output panel (monitor) audio mute button to monitor-only mute.
         This only affects local preview audio, not the stream audio.
         """
         try:
-            btn = getattr(self.window, 'audioTopButton', None)
-            if not btn:
+            btn = self._ui_controls()[0].get('audioTopButton')
+            if btn is None:
                 return
             # Ensure unchecked (unmuted) by default
             try:
-                btn.setChecked(False)
+                with QSignalBlocker(btn):
+                    btn.setChecked(False)
                 self._toggle_button_icon(btn, False)
             except Exception:
                 pass
             btn.toggled.connect(self.on_output_panel_mute_toggle)
         except Exception as e:
-            print(f"Error connecting output panel audio button: {e}")
+            log.warning("Error connecting output panel audio button: %s", e)
 
     def on_output_panel_mute_toggle(self, checked: bool):
         """Monitor-only mute toggle handler for output panel button."""
         try:
             # Update icon
-            try:
-                self._toggle_button_icon(self.window.audioTopButton, checked)
-            except Exception:
-                pass
+            if self._btn_audio_top is not None:
+                self._toggle_button_icon(self._btn_audio_top, checked)
             # Apply to AudioCompositor monitor branch only
             if getattr(self, 'audio_compositor', None):
                 self.audio_compositor.set_monitor_muted(bool(checked))
-            print(f"Output panel audio {'muted' if checked else 'unmuted'}")
         except Exception as e:
-            print(f"Error toggling output panel audio: {e}")
+            log.warning("Error toggling output panel audio: %s", e)
 
     # --- Integration hooks (no-ops for now; to be wired to GStreamer when ready) ---
+    def _ac_is_present(self, name: str) -> bool:
+        return bool((self._ac_present_mask >> _SOURCE_BITS[name]) & 1)
+
+    def _ac_mark_present(self, name: str) -> None:
+        self._ac_present_mask |= 1 << _SOURCE_BITS[name]
+        # A freshly added source starts from the compositor's default mute state
+        self._last_applied_mute.pop(name, None)
+
+    def _ac_mark_absent(self, name: str) -> None:
+        self._ac_present_mask &= ~(1 << _SOURCE_BITS[name])
+        self._last_applied_mute.pop(name, None)
+
+    @property
+    def _ac_present_sources(self):
+        """Snapshot of the logical source names currently registered in AudioCompositor."""
+        mask = self._ac_present_mask
+        return frozenset(n for n, bit in _SOURCE_BITS.items() if (mask >> bit) & 1)
+
+    @property
+    def _ac_media_sources(self):
+        """Media names currently registered in AudioCompositor (media partition of the mask)."""
+        mask = self._ac_present_mask & _MEDIA_MASK
+        if not mask:
+            return ()
+        return tuple(n for n, bit in _SOURCE_BITS.items() if (mask >> bit) & 1)
+
     def _apply_per_input_mute(self, source_type: str, source_name: str, muted: bool):
+        muted = bool(muted)
+        if self._last_applied_mute.get(source_name) == muted:
+            return
         try:
             # If an audio compositor is available, toggle mute for the logical input
             if getattr(self, 'audio_compositor', None):
                 # Map directly by logical name; compositor is expected to have sources with same names
-                self.audio_compositor.set_input_muted(source_name, bool(muted))
+                self.audio_compositor.set_input_muted(source_name, muted)
+                self._last_applied_mute[source_name] = muted
         except Exception as e:
-            print(f"Warning: Failed applying mute to {source_name}: {e}")
+            log.warning("Failed applying mute to %s: %s", source_name, e)
 
     def _apply_audio_for_active_source(self, source_type: str, source_name: str) -> None:
         """Route audio in AudioCompositor so only the active source is audible.
 
         - Ensures the active logical source exists in `AudioCompositor`.
         - Keeps only the active logical source's audio path present; removes others to avoid bleed.
+        - Mutes every other input still present, not just the previously active one.
         - Sets the active source unmuted (unless per-source or master mute applies).
         """
         try:
@@ -666,81 +900,25 @@ class VideoInputManager:
             if not ac:
                 return
 
-            # Helper to ensure presence in AC
-            def ensure_ac_source(name: str, stype: str):
-                try:
-                    if name in self._ac_present_sources:
-                        return
-                    if stype == 'input':
-                        ac.add_auto_source(name)
-                        self._ac_present_sources.add(name)
-                    elif stype == 'media':
-                        fpath = self.media_files.get(name)
-                        if fpath:
-                            ac.add_media_file_source(name, fpath)
-                            self._ac_present_sources.add(name)
-                except Exception as e:
-                    print(f"Warning: ensure_ac_source failed for {name}: {e}")
-
-            # Before adding/activating, remove conflicting categories to prevent background audio
-            try:
-                # If switching to media, remove all other media sources from AC
-                if source_type == 'media':
-                    for n in list(self._ac_present_sources):
-                        if n.startswith('media') and n != source_name:
-                            try:
-                                ac.remove_source(n)
-                            except Exception:
-                                pass
-                            self._ac_present_sources.discard(n)
-                # If switching to input, remove all media sources from AC
-                else:
-                    for n in list(self._ac_present_sources):
-                        if n.startswith('media'):
-                            try:
-                                ac.remove_source(n)
-                            except Exception:
-                                pass
-                            self._ac_present_sources.discard(n)
-            except Exception as e:
-                print(f"Warning: failed pruning AC sources: {e}")
-
-            # Ensure active source exists in AC (after pruning)
-            ensure_ac_source(source_name, source_type)
-
-            # Calculate target mute states
-            def target_muted(name: str) -> bool:
-                # Respect master mute and per-source mute
-                if self.master_muted:
-                    return True
-                if self.muted_inputs.get(name, False):
-                    return True
-                return False
-
-            # Quickly switch by only touching previous active and new active
-            prev = getattr(self, '_active_audio_name', None)
-            if prev and prev != source_name:
-                try:
-                    # Remove previous media audio entirely to ensure no residual playback
-                    if prev.startswith('media') and source_type == 'media':
-                        try:
-                            ac.remove_source(prev)
-                        except Exception:
-                            pass
-                        self._ac_present_sources.discard(prev)
-                    else:
-                        ac.set_input_muted(prev, True)
-                except Exception:
-                    pass
-            # Set current active mute state
-            try:
-                ac.set_input_muted(source_name, target_muted(source_name))
-            except Exception as e:
-                print(f"Warning: failed to set mute for active {source_name}: {e}")
+            # One compositor call diffs adds/removes and mutes against its own state
+            media_files = {n: slot.file for n, slot in self.media.items() if slot.file}
+            present = ac.apply_routing(source_name, source_type, media_files,
+                                       self.muted_inputs, self.master_muted)
+            if source_name not in present:
+                log.warning("AudioCompositor could not add %s; no source is routed to the mix", source_name)
+            # Mirror the compositor's present set for read-back
+            mask = 0
+            for name in present:
+                bit = _SOURCE_BITS.get(name)
+                if bit is not None:
+                    mask |= 1 << bit
+            self._ac_present_mask = mask
+            # The routing supersedes any individually applied mutes
+            self._last_applied_mute.clear()
             self._active_audio_name = source_name
 
         except Exception as e:
-            print(f"Warning: _apply_audio_for_active_source error: {e}")
+            log.warning("_apply_audio_for_active_source error: %s", e)
 
     def _silence_audio_compositor_for_media_monitor(self):
         """Mute all AudioCompositor inputs so only media pipeline monitor audio is heard."""
@@ -748,13 +926,13 @@ class VideoInputManager:
         if not ac:
             return
         try:
-            for nm in ['input1','input2','input3','media1','media2','media3']:
+            for nm in _SOURCE_BITS:
                 try:
                     ac.set_input_muted(nm, True)
                 except Exception:
                     pass
         except Exception as e:
-            print(f"Warning: failed to mute AudioCompositor inputs: {e}")
+            log.warning("Failed to mute AudioCompositor inputs: %s", e)
 
     def _snapshot_media_position(self, media_name: str):
         """Capture current playback position (ns) for the given media from active pipelines."""
@@ -778,16 +956,20 @@ class VideoInputManager:
                 pass
 
     def _apply_master_mute(self, muted: bool):
+        if self._last_applied_master == muted:
+            return
         try:
             if getattr(self, 'audio_compositor', None):
                 vol = 0.0 if muted else 1.0
                 self.audio_compositor.set_master_volume(vol)
+                self._last_applied_master = muted
         except Exception as e:
-            print(f"Warning: Failed applying master mute: {e}")
+            log.warning("Failed applying master mute: %s", e)
     
     def open_source_dialog(self, input_name):
         """Open video source selection dialog for specified input"""
-        current_source = self.input_sources.get(input_name)
+        slot = self.inputs.get(input_name)
+        current_source = slot.source if slot else None
         dialog = VideoSourceDialog(current_source, self.window)
         
         if dialog.exec() == dialog.DialogCode.Accepted:
@@ -798,103 +980,156 @@ class VideoInputManager:
     def set_input_source(self, input_name, camera_device):
         """Set video source for specified input"""
         try:
-            # Stop and cleanup existing camera if any
-            if self.input_cameras[input_name]:
-                old_camera = self.input_cameras[input_name]
-                old_camera.stop()
+            slot = self.inputs[input_name]
+            camera = slot.camera
+            # Only tear down a camera that has failed; a healthy one is retargeted
+            if camera is not None and camera.error() != QCamera.Error.NoError:
+                camera.stop()
                 # Disconnect from session before destroying
-                session = self.input_sessions[input_name]
+                session = slot.session
                 if session:
                     session.setCamera(None)
                     # Keep sink bound to widget; no need to clear video output here
-                # Clean up the old camera
-                old_camera.deleteLater()
-                self.input_cameras[input_name] = None
-                
-            # Create new camera
-            camera = QCamera(camera_device)
-            self.input_cameras[input_name] = camera
-            self.input_sources[input_name] = camera_device
+                camera.deleteLater()
+                camera = None
+                slot.camera = None
+            
+            if camera is None:
+                # First use (or after an error): create the camera for this input
+                camera = QCamera(camera_device)
+            else:
+                # Reuse the existing QCamera and just switch its device
+                camera.stop()
+                camera.setCameraDevice(camera_device)
+            slot.camera = camera
+            slot.source = camera_device
             
             # ENHANCED: Select highest quality format available
-            try:
-                formats = camera_device.videoFormats()
-                if formats:
-                    # Log available formats for debugging
-                    print(f"Available formats for {input_name}:")
-                    for fmt in formats[:5]:  # Show first 5 formats
-                        sz = fmt.resolution()
-                        print(f"  {sz.width()}x{sz.height()}")
-                    
-                    # QUALITY ENHANCEMENT: Select best format
-                    best_format = None
-                    best_score = 0
-                    
-                    for fmt in formats:
-                        sz = fmt.resolution()
-                        width, height = sz.width(), sz.height()
-                        
-                        # Calculate quality score (resolution * frame rate)
-                        fps = fmt.maxFrameRate()
-                        score = width * height * fps
-                        
-                        # Prefer common high-quality resolutions
-                        if width >= 1280 and height >= 720:  # HD or better
-                            score *= 2  # Bonus for HD+
-                        if width >= 1920 and height >= 1080:  # Full HD
-                            score *= 1.5  # Extra bonus for Full HD
-                        
-                        if score > best_score:
-                            best_score = score
-                            best_format = fmt
-                    
-                    # Apply best format if found
-                    if best_format:
-                        try:
-                            camera.setCameraFormat(best_format)
-                            sz = best_format.resolution()
-                            fps = best_format.maxFrameRate()
-                            print(f"✅ Set {input_name} to MAXIMUM QUALITY: {sz.width()}x{sz.height()} @ {fps}fps")
-                        except Exception as e:
-                            print(f"Could not set camera format for {input_name}: {e}")
-                    
-            except Exception as e:
-                print(f"Could not list camera formats for {input_name}: {e}")
+            best_format = self._best_camera_format(input_name, camera_device)
+            if best_format is not None:
+                try:
+                    camera.setCameraFormat(best_format)
+                    sz = best_format.resolution()
+                    fps = best_format.maxFrameRate()
+                    log.debug("✅ Set %s to MAXIMUM QUALITY: %sx%s @ %sfps", input_name, sz.width(), sz.height(), fps)
+                except Exception as e:
+                    log.debug("Could not set camera format for %s: %s", input_name, e)
 
-            # Set camera to session and start
-            session = self.input_sessions[input_name]
-            video_widget = self.input_widgets[input_name]
+            # Set camera to session and start (widget/session are created on first use)
+            video_widget, session = self._ensure_input_widget(input_name)
             
             if session and video_widget:
-                # Ensure session is connected to the video widget
-                session.setVideoOutput(video_widget)
-                print(f"Video output set for {input_name}")
+                # Ensure session is connected to the video widget (deferred until it is shown)
+                if video_widget.isVisible():
+                    session.setVideoOutput(video_widget)
+                    self._paused_outputs.pop(input_name, None)
+                else:
+                    session.setVideoOutput(None)
+                    self._paused_outputs[input_name] = video_widget
+                if self._current_output_producer is session:
+                    self._current_output_producer = None
+                log.debug("Video output set for %s", input_name)
                 
                 # Then set camera to session
                 session.setCamera(camera)
-                print(f"Camera set to session for {input_name}")
+                log.debug("Camera set to session for %s", input_name)
                 
                 # Start the camera
                 camera.start()
-                print(f"Camera started for {input_name}")
+                log.info("Camera started for %s", input_name)
                 
                 # Update input label to show selected source
-                self.update_input_label(input_name, camera_device.description())
-                print(f"Successfully set {input_name} to {camera_device.description()}")
-                print(f"Camera session connected to video widget for {input_name}")
+                desc = self._camera_description(camera_device)
+                self.update_input_label(input_name, desc)
+                log.info("Successfully set %s to %s", input_name, desc)
+                log.debug("Camera session connected to video widget for %s", input_name)
             else:
-                print(f"Error: No session or video widget found for {input_name}")
+                log.warning("No session or video widget found for %s", input_name)
                 if not session:
-                    print(f"  Session is None for {input_name}")
+                    log.debug("  Session is None for %s", input_name)
                     
-        except Exception as e:
-            print(f"Error setting camera for {input_name}: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            log.exception("Error setting camera for %s", input_name)
+    
+    def _camera_formats(self, input_name, camera_device):
+        """Return the device's video formats, enumerating the hardware only once per device"""
+        key = bytes(camera_device.id())
+        formats = VideoInputManager._formats_cache.get(key)
+        if formats is None:
+            try:
+                formats = camera_device.videoFormats()
+            except Exception as e:
+                log.debug("Could not list camera formats for %s: %s", input_name, e)
+                return []
+            VideoInputManager._formats_cache[key] = formats
+        return formats
+
+    def _best_camera_format(self, input_name, camera_device):
+        """Return the highest quality format for the device, ranking its formats only once"""
+        key = bytes(camera_device.id())
+        if key in VideoInputManager._best_format_cache:
+            return VideoInputManager._best_format_cache[key]
+        formats = self._camera_formats(input_name, camera_device)
+        if not formats:
+            return None
+        # Log available formats for debugging
+        if os.environ.get("DEBUG_CAMERA_FORMATS"):
+            log.debug("Available formats for %s:", input_name)
+            for fmt in formats[:5]:  # Show first 5 formats
+                sz = fmt.resolution()
+                log.debug("  %sx%s", sz.width(), sz.height())
+        
+        # QUALITY ENHANCEMENT: Select best format, scoring all formats in one vectorized pass
+        width, height, fps = _format_table(formats)
+        # Quality score is resolution * frame rate, with bonuses for HD+ (x2) and Full HD (x1.5)
+        score = width * height * fps
+        score *= np.where((width >= 1280) & (height >= 720), 2.0, 1.0)
+        score *= np.where((width >= 1920) & (height >= 1080), 1.5, 1.0)
+        best_idx = int(score.argmax())  # first of equal scores, as before
+        best_format = formats[best_idx] if score[best_idx] > 0 else None
+        
+        VideoInputManager._best_format_cache[key] = best_format
+        return best_format
+
+    def _camera_description(self, camera_device):
+        """Return the device's description, fetched from Qt once per device"""
+        key = bytes(camera_device.id())
+        desc = VideoInputManager._device_desc_cache.get(key)
+        if desc is None:
+            desc = camera_device.description()
+            VideoInputManager._device_desc_cache[key] = desc
+        return desc
     
+    def _ensure_media_player(self, media_name):
+        """Create the player for a media slot on first use (no audio output until it is audible)"""
+        slot = self.media[media_name]
+        if slot.player is None:
+            player = QMediaPlayer()
+            # Cache status changes so callers read a scalar instead of polling the player
+            player.mediaStatusChanged.connect(partial(self._on_media_status, media_name))
+            slot.player = player
+        return slot.player
+
+    def _claim_audio_output(self, media_name):
+        """Move the shared QAudioOutput onto the given media's player and return it"""
+        output = self._shared_audio_output
+        if output is None:
+            output = self._shared_audio_output = QAudioOutput()
+            output.setVolume(0.0)
+        owner = self._audio_output_owner
+        if owner == media_name:
+            return output
+        previous = self._media_player(owner) if owner else None
+        if previous is not None:
+            previous.setAudioOutput(None)
+        player = self._ensure_media_player(media_name)
+        player.setAudioOutput(output)
+        self._audio_output_owner = media_name
+        return output
+
     def open_media_dialog(self, media_name):
         """Open media file selection dialog for specified media input"""
-        current_file = self.media_files.get(media_name)
+        current_file = self._media_file(media_name)
         dialog = MediaFileDialog(current_file, self.window)
         
         if dialog.exec() == dialog.DialogCode.Accepted:
@@ -905,99 +1140,125 @@ class VideoInputManager:
     def set_media_file(self, media_name, file_path):
         """Set media file for specified media input"""
         try:
-            # Stop and cleanup existing player if any
-            if self.media_players[media_name]:
-                old_player = self.media_players[media_name]
-                old_player.stop()
-                old_player.setVideoOutput(None)
-                old_player.deleteLater()
-                self.media_players[media_name] = None
+            # Reuse the slot's player across file selections; only the source changes
+            slot = self.media[media_name]
+            player = self._ensure_media_player(media_name)
+            player.stop()
             
-            # Create new player and connect to video widget
-            player = QMediaPlayer()
-            video_widget = self.media_widgets[media_name]
+            video_widget = self._ensure_media_widget(media_name)
             if video_widget:
                 # Connect video output FIRST
-                player.setVideoOutput(video_widget)
-                print(f"Connected media player to video widget for {media_name}")
+                if player.videoOutput() is not video_widget:
+                    player.setVideoOutput(video_widget)
+                    if self._current_output_producer is player:
+                        self._current_output_producer = None
+                    log.debug("Connected media player to video widget for %s", media_name)
             else:
-                print(f"Warning: No video widget found for {media_name}")
+                log.warning("No video widget found for %s", media_name)
             
-            # AUDIO SYNC ENHANCEMENT: Create audio output with 0 volume for preview
-            audio_output = QAudioOutput()
-            audio_output.setVolume(0.0)  # Start with 0 volume for synchronized preview
-            player.setAudioOutput(audio_output)
-            self.media_audio_outputs[media_name] = audio_output
-            print(f"✅ Audio sync setup: {media_name} starts with 0 volume for preview")
-            
-            self.media_players[media_name] = player
+            # AUDIO SYNC ENHANCEMENT: Audio output starts with 0 volume for preview
+            self._set_media_audio_volume(media_name, 0.0)  # Start with 0 volume for synchronized preview
+            log.debug("✅ Audio sync setup: %s starts with 0 volume for preview", media_name)
                 
             # Set new media file
             if player:
-                from PyQt6.QtCore import QUrl
                 player.setSource(QUrl.fromLocalFile(file_path))
-                self.media_files[media_name] = file_path
+                slot.file = file_path
                 # Do NOT route media audio into AudioCompositor here.
                 # We will attach only the currently active media (1-A) during source switch
                 # to guarantee that non-active media are silent in both monitor and stream.
                 
                 # Update media label to show selected file
-                file_name = Path(file_path).name
+                file_name = os.path.basename(file_path)
                 self.update_media_label(media_name, file_name)
-                print(f"Successfully set {media_name} to {file_name}")
+                log.info("Successfully set %s to %s", media_name, file_name)
                 
-                # Auto-play the media
-                player.play()
-                print(f"Started playing media file for {media_name}")
+                # Pre-buffer: pause() loads and decodes the first frame now, so taking the
+                # media to output later does not stall; playback starts in switch_to_output
+                self._play_when_ready.discard(media_name)
+                self._priming.discard(media_name)
+                self._prime_pending.add(media_name)
+                # Progress updates skip paused players, so rewind the slider here
+                slider = self._media_sliders.get(media_name)
+                if slider is not None:
+                    with QSignalBlocker(slider):
+                        slider.setValue(0)
+                    self._last_progress[media_name] = 0
+                player.pause()
+                log.info("Pre-buffering media file for %s", media_name)
                 
                 # Update button state to reflect playing state
                 self.update_media_button_state(media_name)
             else:
-                print(f"Error: No player found for {media_name}")
+                log.warning("No player found for %s", media_name)
                 
+        except Exception:
+            log.exception("Error setting media file for %s", media_name)
+    
+    def _on_media_status(self, media_name, status):
+        """Record the latest media status reported by a slot's player"""
+        self.media_status[media_name] = status
+        # Slot boundary: an exception escaping a signal handler would abort the app
+        try:
+            # Start a media that was switched to output while it was still loading
+            if status in _MEDIA_PLAYABLE and media_name in self._play_when_ready:
+                self._play_when_ready.discard(media_name)
+                self._prime_pending.discard(media_name)
+                player = self._media_player(media_name)
+                if player is not None:
+                    player.play()
+                    self.update_media_button_state(media_name)
+            elif status == QMediaPlayer.MediaStatus.LoadedMedia and media_name in self._prime_pending:
+                # Play ~100 ms while silent so the decoders allocate now rather than on first take
+                self._prime_pending.discard(media_name)
+                player = self._media_player(media_name)
+                if player is not None:
+                    self._priming.add(media_name)
+                    player.play()
+                    QTimer.singleShot(100, partial(self._end_media_prime, media_name))
         except Exception as e:
-            print(f"Error setting media file for {media_name}: {e}")
-            import traceback
-            traceback.print_exc()
+            log.warning("Error handling media status for %s: %s", media_name, e)
+
+    def _end_media_prime(self, media_name):
+        """Rewind a primed media, unless the prime no longer owns its player"""
+        if media_name not in self._priming:
+            return
+        self._priming.discard(media_name)
+        if self.current_output_source == ('media', media_name):
+            return
+        player = self._media_player(media_name)
+        if player is not None:
+            player.pause()
+            player.setPosition(0)
     
     def update_input_label(self, input_name, source_name):
         """Update input label to show selected source name"""
-        # Map input names to actual label names in UI
-        label_mappings = {
-            'input1': 'label_input1',
-            'input2': 'label_input2', 
-            'input3': 'label_input3'
-        }
-        
-        label_name = label_mappings.get(input_name)
-        if label_name and hasattr(self.window, label_name):
-            label = getattr(self.window, label_name)
-            # Truncate long names
-            display_name = source_name[:15] + "..." if len(source_name) > 15 else source_name
-            label.setText(display_name)
-        else:
-            print(f"Warning: Label {label_name} not found for {input_name}")
+        self._set_source_label(input_name, source_name)
     
     def update_media_label(self, media_name, file_name):
         """Update media label to show selected file name"""
-        # Map media names to actual label names in UI
-        label_mappings = {
-            'media1': 'label_media1',
-            'media2': 'label_media2', 
-            'media3': 'label_media3'
-        }
-        
-        label_name = label_mappings.get(media_name)
-        if label_name and hasattr(self.window, label_name):
-            label = getattr(self.window, label_name)
-            # Truncate long names
-            display_name = file_name[:15] + "..." if len(file_name) > 15 else file_name
-            label.setText(display_name)
-        else:
-            print(f"Warning: Label {label_name} not found for {media_name}")
+        self._set_source_label(media_name, file_name)
+
+    def _set_source_label(self, name, text):
+        label = self._labels.get(name)
+        if label is None:
+            log.warning("Label not found for %s", name)
+            return
+        # Truncate long names
+        display_name = text if len(text) <= 15 else text[:15] + "..."
+        # Skip setText (and its repaint) when the label already shows this text
+        if self._last_label_text.get(name) == display_name:
+            return
+        label.setText(display_name)
+        self._last_label_text[name] = display_name
     
     def switch_to_output(self, source_type, source_name):
         """Switch the specified input or media to the main output preview"""
+        # Re-selecting the live source would only blank and renegotiate the output
+        if (self.current_output_source == (source_type, source_name)
+                and self.output_preview_widget is not None
+                and self._current_output_producer is not None):
+            return
         try:
             # Clear previous output connections first
             self._clear_current_output()
@@ -1010,100 +1271,107 @@ class VideoInputManager:
                     if hasattr(self, '_preview_streamer'):
                         self._preview_streamer = None
                 except Exception as _e:
-                    print(f"Warning: failed clearing media streamers on input switch: {_e}")
+                    log.warning("failed clearing media streamers on input switch: %s", _e)
                 # Switch camera input to output
-                if source_name in self.input_cameras and self.input_cameras[source_name]:
-                    camera = self.input_cameras[source_name]
-                    session = self.input_sessions[source_name]
+                slot = self.inputs.get(source_name)
+                if slot and slot.camera:
+                    session = slot.session
 
                     if not session or not self.output_preview_widget:
-                        print(f"Error: Invalid session or output widget for {source_name}")
+                        log.warning("Invalid session or output widget for %s", source_name)
                         return
 
-                    # CRITICAL FIX: Add small delay to ensure clearing is complete
-                    from PyQt6.QtCore import QTimer
-                    def _assign_camera_output():
-                        try:
-                            # Route camera frames to QVideoSink, which will feed the graphics item
-                            if self._qvideosink is not None:
-                                session.setVideoOutput(self._qvideosink)
-                                print(f"✅ Assigned {source_name} to QVideoSink")
-                            else:
-                                print("Error: QVideoSink unavailable; cannot display camera on output")
-                                return
-
-                            # Ensure camera is running
-                            if not camera.isActive():
-                                camera.start()
-                                print(f"✅ Started camera {source_name}")
-                                
-                        except Exception as e:
-                            print(f"Error assigning camera output: {e}")
-                    
-                    # Use QTimer to delay the assignment slightly
-                    QTimer.singleShot(50, _assign_camera_output)
+                    # Render straight into the output video item, like media players do;
+                    # only outputs without one go through the shared QVideoSink
+                    if self._output_accepts_video:
+                        target = self.output_preview_widget
+                    else:
+                        target = self.qvideosink
+                        if target is None:
+                            log.warning("QVideoSink unavailable; cannot display camera on output")
+                            return
+                        if not self._sink_connected:
+                            target.videoFrameChanged.connect(self._on_sink_frame)
+                            self._sink_connected = True
+
+                    # Rebind now; camera start and audio routing run once the event loop is free
+                    self._paused_outputs.pop(source_name, None)
+                    session.setVideoOutput(target)
+                    self._current_output_producer = session
+                    log.debug("✅ Assigned %s to output", source_name)
 
                     self.current_output_source = (source_type, source_name)
-                    print(f"Switched output to {source_name} camera")
-                    
-                    # Update audio routing: enable only this input's mic; disable others and all media audio
-                    self._apply_audio_for_active_source('input', source_name)
+                    self._switch_epoch += 1
+                    QTimer.singleShot(0, partial(self._finish_switch_input, self._switch_epoch, source_name))
+                    log.info("Switched output to %s camera", source_name)
                 else:
-                    print(f"No camera assigned to {source_name}. Please select a camera first.")
+                    log.debug("No camera assigned to %s. Please select a camera first.", source_name)
 
             elif source_type == 'media':
                 # Switch media file to output
-                if source_name in self.media_players and self.media_players[source_name]:
-                    player = self.media_players[source_name]
+                slot = self.media.get(source_name)
+                if slot and slot.player:
+                    player = slot.player
 
                     if not self.output_preview_widget:
-                        print(f"Error: Invalid output widget for {source_name}")
+                        log.warning("Invalid output widget for %s", source_name)
                         return
 
-                    # CRITICAL FIX: Add small delay to ensure clearing is complete
-                    from PyQt6.QtCore import QTimer
-                    def _assign_media_output():
-                        try:
-                            # Assign video output to media player
-                            player.setVideoOutput(self.output_preview_widget)
-                            print(f"✅ Assigned {source_name} to output widget")
-                            
-                            # Ensure media is playing
-                            from PyQt6.QtMultimedia import QMediaPlayer
-                            if player.playbackState() != QMediaPlayer.PlaybackState.PlayingState:
-                                player.play()
-                                print(f"✅ Started playing {source_name}")
-                            
-                        except Exception as e:
-                            print(f"Error assigning media output: {e}")
-                    
-                    # Use QTimer to delay the assignment slightly
-                    QTimer.singleShot(50, _assign_media_output)
-                    
-                    # AUDIO SYNC ENHANCEMENT: Increase volume when media is selected for output
-                    self._set_media_audio_volume(source_name, 1.0)  # Full volume for output
+                    # Rebind now; playback and audio routing run once the event loop is free
+                    player.setVideoOutput(self.output_preview_widget)
+                    self._current_output_producer = player
+                    log.debug("✅ Assigned %s to output widget", source_name)
 
                     self.current_output_source = (source_type, source_name)
-                    print(f"Switched output to {source_name} media")
-                    
-                    # AUDIO SYNC FIX: Use direct QAudioOutput control for reliable audio
-                    # Remove all media from AudioCompositor to prevent duplicate audio
-                    self._remove_all_media_from_audio_compositor()
-                    # Ensure all other media is muted
-                    self._mute_all_media_audio()
-                    # Then unmute only the active media
-                    self._set_media_audio_volume(source_name, 1.0)
-                    print(f"✅ Audio sync: Using direct audio control, AudioCompositor bypassed")
+                    self._switch_epoch += 1
+                    QTimer.singleShot(0, partial(self._finish_switch_media, self._switch_epoch, source_name))
+                    log.info("Switched output to %s media", source_name)
                 else:
-                    print(f"No media file assigned to {source_name}. Please select a media file first.")
+                    log.debug("No media file assigned to %s. Please select a media file first.", source_name)
+
+        except Exception:
+            log.exception("Error switching to %s %s", source_type, source_name)
 
+    def _finish_switch_input(self, epoch, source_name):
+        """Deferred half of switch_to_output for cameras; skipped if a newer switch happened"""
+        if epoch != self._switch_epoch:
+            return
+        try:
+            slot = self.inputs.get(source_name)
+            camera = slot.camera if slot else None
+            if camera is not None and not camera.isActive():
+                camera.start()
+                log.debug("✅ Started camera %s", source_name)
+            # Update audio routing: enable only this input's mic; disable others and all media audio
+            self._apply_audio_for_active_source('input', source_name)
+        except Exception as e:
+            log.warning("Error finishing switch to %s: %s", source_name, e)
+
+    def _finish_switch_media(self, epoch, source_name):
+        """Deferred half of switch_to_output for media; skipped if a newer switch happened"""
+        if epoch != self._switch_epoch:
+            return
+        try:
+            # The output owns the player now, even if its warm-up play is still running
+            self._priming.discard(source_name)
+            player = self._media_player(source_name)
+            if player is not None and player.playbackState() != _PLAYING:
+                # Play only once the pre-buffered media is loaded; otherwise defer to _on_media_status
+                if self.media_status.get(source_name) in _MEDIA_PLAYABLE:
+                    player.play()
+                    log.debug("✅ Started playing %s", source_name)
+                else:
+                    self._play_when_ready.add(source_name)
+            # AUDIO SYNC FIX: Use direct QAudioOutput control for reliable audio
+            self._set_exclusive_media_audio(source_name)
+            log.debug("✅ Audio sync: Using direct audio control, AudioCompositor bypassed")
         except Exception as e:
-            print(f"Error switching to {source_type} {source_name}: {e}")
+            log.warning("Error finishing switch to %s: %s", source_name, e)
 
     def _clear_current_output(self):
         """Clear current output connections to prevent conflicts"""
         try:
-            print(f"Clearing current output: {self.current_output_source}")
+            log.debug("Clearing current output: %s", self.current_output_source)
             
             # Snapshot position for current media before tearing down
             try:
@@ -1112,61 +1380,51 @@ class VideoInputManager:
                     
                     # AUDIO SYNC FIX: Remove media from AudioCompositor to prevent duplicate audio
                     media_name = self.current_output_source[1]
+                    # A media leaving the output should not start once it finishes loading
+                    self._play_when_ready.discard(media_name)
                     if hasattr(self, 'audio_compositor') and self.audio_compositor:
                         try:
-                            if media_name in self._ac_present_sources:
+                            if self._ac_is_present(media_name):
                                 self.audio_compositor.remove_source(media_name)
-                                self._ac_present_sources.discard(media_name)
-                                print(f"✅ Removed {media_name} from AudioCompositor to prevent duplicate audio")
+                                self._ac_mark_absent(media_name)
+                                log.debug("✅ Removed %s from AudioCompositor to prevent duplicate audio", media_name)
                         except Exception as e:
-                            print(f"Warning: Could not remove {media_name} from AudioCompositor: {e}")
+                            log.warning("Could not remove %s from AudioCompositor: %s", media_name, e)
             except Exception:
                 pass
                 
-            # CRITICAL FIX: Clear ALL video output connections completely
-            
-            # 1. Clear all camera sessions from ALL possible outputs
-            for input_name, session in self.input_sessions.items():
-                if session:
-                    try:
-                        # Clear from QVideoSink
-                        if self._qvideosink and session.videoOutput() == self._qvideosink:
-                            session.setVideoOutput(None)
-                            print(f"✅ Cleared {input_name} from QVideoSink")
-                        
-                        # Clear from direct output widget
-                        if hasattr(session, 'videoOutput') and session.videoOutput() == self.output_preview_widget:
-                            session.setVideoOutput(None)
-                            print(f"✅ Cleared {input_name} from output widget")
-                            
-                    except Exception as e:
-                        print(f"Warning: Error clearing {input_name} session: {e}")
+            # 1. Detach whichever session or player is feeding the output
+            producer = self._current_output_producer
+            if producer is not None:
+                try:
+                    producer.setVideoOutput(None)
+                    log.debug("✅ Detached %s from output", self.current_output_source)
+                except Exception as e:
+                    log.warning("Error detaching output producer: %s", e)
+                finally:
+                    self._current_output_producer = None
+            # Nothing feeds the shared sink now; drop the per-frame Python callback
+            if self._sink_connected:
+                try:
+                    self._qvideosink.videoFrameChanged.disconnect(self._on_sink_frame)
+                except TypeError:
+                    pass
+                self._sink_connected = False
 
-            # 2. Clear all media players from output and mute their audio
-            for media_name, player in self.media_players.items():
-                if player:
-                    try:
-                        # Clear video output if connected
-                        if hasattr(player, 'videoOutput') and player.videoOutput() == self.output_preview_widget:
-                            player.setVideoOutput(None)
-                            print(f"✅ Cleared {media_name} from output widget")
-                        
-                        # Mute audio when media is no longer active
-                        self._set_media_audio_volume(media_name, 0.0)
-                        
-                    except Exception as e:
-                        print(f"Warning: Error clearing {media_name} player: {e}")
+            # 2. Mute the outgoing media; other players are already silent
+            if self.current_output_source and self.current_output_source[0] == 'media':
+                self._set_media_audio_volume(self.current_output_source[1], 0.0)
             
             # 3. CRITICAL: Clear the graphics video item if it exists
             try:
                 if hasattr(self.output_preview_widget, 'clear_video_frame'):
                     self.output_preview_widget.clear_video_frame()
-                    print("✅ Cleared graphics video frame")
+                    log.debug("✅ Cleared graphics video frame")
                 elif hasattr(self.output_preview_widget, 'set_qimage_frame'):
                     self.output_preview_widget.set_qimage_frame(None)
-                    print("✅ Cleared graphics QImage frame")
+                    log.debug("✅ Cleared graphics QImage frame")
             except Exception as e:
-                print(f"Warning: Could not clear graphics frame: {e}")
+                log.warning("Could not clear graphics frame: %s", e)
             
             # 4. Force a visual update
             try:
@@ -1175,192 +1433,244 @@ class VideoInputManager:
                 if hasattr(self.output_preview_widget, 'repaint'):
                     self.output_preview_widget.repaint()
             except Exception as e:
-                print(f"Warning: Could not force visual update: {e}")
+                log.warning("Could not force visual update: %s", e)
                 
-            print("✅ Output cleared successfully")
+            log.debug("✅ Output cleared successfully")
             
-        except Exception as e:
-            print(f"Error clearing output: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            log.exception("Error clearing output")
     
     def _set_media_audio_volume(self, media_name, volume):
         """Set audio volume for a specific media player (0.0 = muted, 1.0 = full)"""
         try:
-            if media_name in self.media_audio_outputs:
-                audio_output = self.media_audio_outputs[media_name]
-                audio_output.setVolume(volume)
-                status = "muted" if volume == 0.0 else f"{int(volume * 100)}%"
-                print(f"✅ Audio sync: {media_name} volume set to {status}")
-                return True
-            else:
-                print(f"⚠️ No audio output found for {media_name}")
+            if media_name not in self.media:
+                log.warning("⚠️ No audio output found for %s", media_name)
                 return False
+            if volume > 0.0:
+                # Audible: the shared output follows this player
+                audio_output = self._claim_audio_output(media_name)
+            elif self._audio_output_owner == media_name:
+                audio_output = self._shared_audio_output
+            else:
+                # Players without the shared output are already silent
+                return True
+            if audio_output.volume() != volume:
+                audio_output.setVolume(volume)
+            status = "muted" if volume == 0.0 else f"{int(volume * 100)}%"
+            log.debug("✅ Audio sync: %s volume set to %s", media_name, status)
+            return True
         except Exception as e:
-            print(f"❌ Error setting audio volume for {media_name}: {e}")
+            log.warning("❌ Error setting audio volume for %s: %s", media_name, e)
             return False
     
-    def _mute_all_media_audio(self):
-        """Mute all media audio for synchronized preview"""
-        try:
-            for media_name in self.media_audio_outputs.keys():
-                self._set_media_audio_volume(media_name, 0.0)
-            print("✅ All media audio muted for synchronized preview")
-        except Exception as e:
-            print(f"❌ Error muting all media audio: {e}")
-    
     def _remove_all_media_from_audio_compositor(self):
         """Remove all media sources from AudioCompositor to prevent duplicate audio"""
         try:
             if hasattr(self, 'audio_compositor') and self.audio_compositor:
-                media_sources_to_remove = [name for name in self._ac_present_sources if name.startswith('media')]
-                for media_name in media_sources_to_remove:
-                    try:
-                        self.audio_compositor.remove_source(media_name)
-                        self._ac_present_sources.discard(media_name)
-                        print(f"✅ Removed {media_name} from AudioCompositor")
-                    except Exception as e:
-                        print(f"Warning: Could not remove {media_name} from AudioCompositor: {e}")
-                
+                media_sources_to_remove = self._ac_media_sources
                 if media_sources_to_remove:
-                    print("✅ All media sources removed from AudioCompositor - using direct audio control")
+                    # An empty mix with no media kept prunes every media source in one call
+                    self.audio_compositor.apply_mix_state({}, present_media=())
+                    for media_name in media_sources_to_remove:
+                        self._ac_mark_absent(media_name)
+                    log.debug("✅ All media sources removed from AudioCompositor - using direct audio control")
+        except Exception as e:
+            log.warning("❌ Error removing media from AudioCompositor: %s", e)
+
+    def _set_exclusive_media_audio(self, active):
+        """Make only the given media audible, at full volume, in one pass"""
+        # Remove all media from AudioCompositor to prevent duplicate audio
+        self._remove_all_media_from_audio_compositor()
+        # The shared output is the only media audio path: moving it onto the active
+        # player silences the previous holder without touching every player
+        try:
+            output = self._claim_audio_output(active)
+            if output.volume() != 1.0:
+                output.setVolume(1.0)
         except Exception as e:
-            print(f"❌ Error removing media from AudioCompositor: {e}")
+            log.warning("❌ Error routing media audio to %s: %s", active, e)
     
+    @property
+    def qvideosink(self):
+        """Fallback sink decoding camera frames for QImage-only outputs, created on first use (None if unavailable)"""
+        if self._qvideosink is None:
+            try:
+                sink = QVideoSink()
+            except Exception as e:
+                log.warning("QVideoSink not available or failed to initialize: %s", e)
+                return None
+            self._qvideosink = sink
+        return self._qvideosink
+
+    def attach_output_item(self, video_item):
+        """Use video_item as the output preview; camera sessions render into it directly"""
+        self.output_preview_widget = video_item
+        # A QGraphicsVideoItem has its own sink, so frames never pass through Python
+        self._output_accepts_video = hasattr(video_item, 'videoSink') and video_item.videoSink() is not None
+        self._bind_output_preview()
+
+    def _bind_output_preview(self):
+        """Cache the current output's frame slot for the QImage fallback path"""
+        self._preview_sink_slot = getattr(self.output_preview_widget, 'set_qimage_frame', None)
+
     def _on_sink_frame(self, frame):
-        """Handle video frames from QVideoSink"""
+        """Handle video frames from QVideoSink (fallback when the output is not a video item)"""
+        sink_slot = self._preview_sink_slot
+        if sink_slot is None or not frame.isValid():
+            return
+        
+        # A fresh image per frame: the output keeps it for painting until the next one
+        image = frame.toImage()
+        if image.isNull():
+            return
+        
+        # Send frame to the output; only this call runs foreign code
         try:
-            if not frame.isValid():
-                return
-            
-            # Convert QVideoFrame to QImage
-            image = frame.toImage()
-            if image.isNull():
-                return
-            
-            # Send frame to graphics output widget if available
-            if self.output_preview_widget and hasattr(self.output_preview_widget, 'set_qimage_frame'):
-                self.output_preview_widget.set_qimage_frame(image)
-                
+            sink_slot(image)
         except Exception as e:
-            print(f"Error processing video frame: {e}")
+            log.warning("Error processing video frame: %s", e)
     
     def _stop_media_streamers(self, restart_scene_streams=True):
         """Stop all media streamers and optionally restart scene streams"""
         try:
             # Stop all media players
-            for player_name, player in self.media_players.items():
+            for player_name, slot in self.media.items():
+                player = slot.player
                 if player:
                     try:
                         player.stop()
-                        print(f"Stopped media player: {player_name}")
+                        log.debug("Stopped media player: %s", player_name)
                     except Exception as e:
-                        print(f"Error stopping media player {player_name}: {e}")
+                        log.warning("Error stopping media player %s: %s", player_name, e)
             
             # Stop preview streamer if active
             if hasattr(self, '_preview_streamer') and self._preview_streamer:
                 try:
                     self._preview_streamer.stop()
                     self._preview_streamer = None
-                    print("Stopped preview streamer")
+                    log.debug("Stopped preview streamer")
                 except Exception as e:
-                    print(f"Error stopping preview streamer: {e}")
+                    log.warning("Error stopping preview streamer: %s", e)
             
             # Clear audio compositor sources if needed
             if self.audio_compositor and hasattr(self.audio_compositor, 'remove_source'):
-                for source_name in list(self._ac_present_sources):
+                # Walk the presence bits directly (no name snapshot) and clear them in one go
+                present, removed = self._ac_present_mask, 0
+                for source_name, bit in _SOURCE_BITS.items():
+                    if not (present >> bit) & 1:
+                        continue
                     try:
                         self.audio_compositor.remove_source(source_name)
-                        self._ac_present_sources.discard(source_name)
+                        removed |= 1 << bit
+                        self._last_applied_mute.pop(source_name, None)
                     except Exception as e:
-                        print(f"Error removing audio source {source_name}: {e}")
+                        log.warning("Error removing audio source %s: %s", source_name, e)
+                self._ac_present_mask &= ~removed
             
-            print("Media streamers stopped successfully")
+            log.debug("Media streamers stopped successfully")
             
         except Exception as e:
-            print(f"Error stopping media streamers: {e}")
+            log.warning("Error stopping media streamers: %s", e)
     
     def cleanup_resources(self):
         """Clean up all video input manager resources"""
         try:
-            print("Cleaning up VideoInputManager resources...")
+            log.debug("Cleaning up VideoInputManager resources...")
             
             # Stop all media streamers
             self._stop_media_streamers(restart_scene_streams=False)
             
             # Stop and cleanup all cameras
-            for input_name, camera in self.input_cameras.items():
+            for input_name, slot in self.inputs.items():
+                camera = slot.camera
                 if camera:
                     try:
                         camera.stop()
-                        print(f"Stopped camera: {input_name}")
+                        log.debug("Stopped camera: %s", input_name)
                     except Exception as e:
-                        print(f"Error stopping camera {input_name}: {e}")
+                        log.warning("Error stopping camera %s: %s", input_name, e)
             
             # Cleanup all camera sessions
-            for input_name, session in self.input_sessions.items():
+            for input_name, slot in self.inputs.items():
+                session = slot.session
                 if session:
                     try:
                         session.setCamera(None)
                         session.setVideoOutput(None)
-                        print(f"Cleaned up camera session: {input_name}")
+                        log.debug("Cleaned up camera session: %s", input_name)
                     except Exception as e:
-                        print(f"Error cleaning up camera session {input_name}: {e}")
+                        log.warning("Error cleaning up camera session %s: %s", input_name, e)
             
             # Cleanup all media players
-            for player_name, player in self.media_players.items():
-                if player:
-                    try:
-                        player.stop()
-                        player.setVideoOutput(None)
-                        player.setAudioOutput(None)
-                        print(f"Cleaned up media player: {player_name}")
-                    except Exception as e:
-                        print(f"Error cleaning up media player {player_name}: {e}")
+            for player_name in self.media:
+                self.reset_media(player_name)
+            
+            # Clear all references (widgets are dropped by their destroyed signal)
+            for slot in self.inputs.values():
+                slot.camera = slot.session = None
             
-            # Clear all references
-            self.input_cameras.clear()
-            self.input_sessions.clear()
-            self.input_widgets.clear()
-            self.media_players.clear()
-            self.media_audio_outputs.clear()
-            self.media_widgets.clear()
+            # Devices may be re-plugged with different formats before the next session
+            VideoInputManager._formats_cache.clear()
+            VideoInputManager._best_format_cache.clear()
             
             # Clear video sink
             if self._qvideosink:
                 try:
                     self._qvideosink.deleteLater()
                     self._qvideosink = None
+                    self._sink_connected = False
                 except Exception as e:
-                    print(f"Error cleaning up video sink: {e}")
+                    log.warning("Error cleaning up video sink: %s", e)
             
-            print("VideoInputManager resources cleaned up successfully")
+            log.info("VideoInputManager resources cleaned up successfully")
             
+        except Exception:
+            log.exception("Error during VideoInputManager cleanup")
+
+    def reset_media(self, media_name):
+        """Tear down a media slot's player; players are otherwise reused (shutdown only)"""
+        slot = self.media.get(media_name)
+        player = slot.player if slot else None
+        if not player:
+            return
+        try:
+            player.stop()
+            player.setVideoOutput(None)
+            player.setAudioOutput(None)
+            player.deleteLater()
+            log.debug("Cleaned up media player: %s", media_name)
         except Exception as e:
-            print(f"Error during VideoInputManager cleanup: {e}")
+            log.warning("Error cleaning up media player %s: %s", media_name, e)
+        slot.player = None
+        if self._audio_output_owner == media_name:
+            self._audio_output_owner = None
+
+    def _media_player(self, media_name):
+        slot = self.media.get(media_name)
+        return slot.player if slot else None
+
+    def _media_file(self, media_name):
+        slot = self.media.get(media_name)
+        return slot.file if slot else None
 
     # Media Control Methods
     def toggle_media_playback(self, media_name):
         """Toggle play/pause for a media player"""
         try:
-            player = self.media_players.get(media_name)
+            player = self._media_player(media_name)
             if not player:
-                print(f"No media player found for {media_name}")
+                log.warning("No media player found for %s", media_name)
                 return
             
             # Get the corresponding button to update its state
-            button_mapping = {
-                'media1': 'pushButton_19',
-                'media2': 'pushButton_20', 
-                'media3': 'pushButton_21'
-            }
-            
-            button_name = button_mapping.get(media_name)
-            button = getattr(self.window, button_name, None) if button_name else None
+            button = self._btn_play.get(media_name)
+            # The user now controls this player; a running warm-up play must not pause/rewind it.
+            # The button still shows that media as paused, so a press during the warm-up means play
+            was_priming = media_name in self._priming
+            self._priming.discard(media_name)
             
             # Check current state and toggle
-            from PyQt6.QtMultimedia import QMediaPlayer
-            if player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
+            if player.playbackState() == _PLAYING and not was_priming:
                 # Currently playing, so pause
                 player.pause()
                 if button:
@@ -1368,7 +1678,8 @@ class VideoInputManager:
                     # Update icon to play (since we're now paused)
                     if hasattr(button, 'play_icon'):
                         button.setIcon(button.play_icon)
-                print(f"Paused {media_name}")
+                    self._last_play_state[media_name] = False
+                log.debug("Paused %s", media_name)
             else:
                 # Currently paused or stopped, so play
                 player.play()
@@ -1377,10 +1688,11 @@ class VideoInputManager:
                     # Update icon to pause (since we're now playing)
                     if hasattr(button, 'pause_icon'):
                         button.setIcon(button.pause_icon)
-                print(f"Playing {media_name}")
+                    self._last_play_state[media_name] = True
+                log.debug("Playing %s", media_name)
                 
         except Exception as e:
-            print(f"Error toggling playback for {media_name}: {e}")
+            log.warning("Error toggling playback for %s: %s", media_name, e)
     
     def on_slider_pressed(self, media_name):
         """Handle when user starts dragging the progress slider"""
@@ -1390,119 +1702,135 @@ class VideoInputManager:
                 self._slider_dragging = {}
             self._slider_dragging[media_name] = True
         except Exception as e:
-            print(f"Error on slider pressed for {media_name}: {e}")
+            log.warning("Error on slider pressed for %s: %s", media_name, e)
     
     def on_slider_released(self, media_name):
         """Handle when user releases the progress slider"""
         try:
-            # Clear dragging state
+            # Clear dragging state and apply the final position right away
             if hasattr(self, '_slider_dragging'):
                 self._slider_dragging[media_name] = False
+            # The user moved the slider, so the next progress tick must write it
+            self._last_progress.pop(media_name, None)
+            if media_name in self._slider_pending:
+                self._flush_slider()
         except Exception as e:
-            print(f"Error on slider released for {media_name}: {e}")
+            log.warning("Error on slider released for %s: %s", media_name, e)
     
     def on_slider_value_changed(self, media_name, value):
         """Handle progress slider value changes"""
         try:
             # Only seek if user is dragging (not automatic updates)
             if hasattr(self, '_slider_dragging') and self._slider_dragging.get(media_name, False):
-                player = self.media_players.get(media_name)
+                # Keep the latest value; the timer applies it once per interval
+                self._slider_pending[media_name] = value
+                if not self._slider_timer.isActive():
+                    self._slider_timer.start()
+        except Exception as e:
+            log.warning("Error on slider value changed for %s: %s", media_name, e)
+
+    def _flush_slider(self):
+        """Seek each media to its latest pending slider value"""
+        self._slider_timer.stop()
+        pending, self._slider_pending = self._slider_pending, {}
+        for media_name, value in pending.items():
+            try:
+                player = self._media_player(media_name)
                 if player and player.duration() > 0:
                     # Convert slider value (0-1000) to position in milliseconds
                     position = int((value / 1000.0) * player.duration())
                     player.setPosition(position)
-                    print(f"Seeking {media_name} to {position}ms")
-        except Exception as e:
-            print(f"Error on slider value changed for {media_name}: {e}")
+                    log.debug("Seeking %s to %sms", media_name, position)
+            except Exception as e:
+                log.warning("Error seeking %s: %s", media_name, e)
     
     def setup_media_progress_updates(self):
         """Set up automatic progress updates for media sliders"""
         try:
-            # Create timers for updating progress sliders
-            if not hasattr(self, '_progress_timers'):
-                self._progress_timers = {}
-                self._slider_dragging = {}
-            
-            from PyQt6.QtCore import QTimer
-            
-            for media_name in ['media1', 'media2', 'media3']:
-                # Create timer for this media
-                timer = QTimer()
-                timer.timeout.connect(lambda mn=media_name: self.update_media_progress(mn))
-                timer.start(100)  # Update every 100ms for smooth progress
-                self._progress_timers[media_name] = timer
-                self._slider_dragging[media_name] = False
+            # One timer ticks every media slider
+            if not hasattr(self, '_progress_timer'):
+                self._progress_timer = QTimer()
+                # Progress ticks can drift a few ms; a coarse timer lets Qt batch the wakeups
+                self._progress_timer.setTimerType(Qt.TimerType.CoarseTimer)
+                self._progress_timer.timeout.connect(self._tick_all_progress)
+                self._slider_dragging = dict.fromkeys(self.media, False)
+            self._progress_timer.start(250)  # 4 Hz is indistinguishable on a 1000-step slider
                 
         except Exception as e:
-            print(f"Error setting up media progress updates: {e}")
+            log.warning("Error setting up media progress updates: %s", e)
     
+    def _tick_all_progress(self):
+        """Advance the progress slider of every media (update_media_progress skips idle ones)"""
+        # One handler per tick rather than per media; an exception escaping a timer slot would abort the app
+        try:
+            for media_name in self.media:
+                self.update_media_progress(media_name)
+        except Exception as e:
+            log.warning("Error updating media progress: %s", e)
+
     def update_media_progress(self, media_name):
         """Update progress slider for a media player"""
-        try:
-            # Don't update if user is dragging
-            if self._slider_dragging.get(media_name, False):
-                return
-                
-            player = self.media_players.get(media_name)
-            if not player or player.duration() <= 0:
+        if self.window is None:
+            return
+        # Don't update if user is dragging
+        if self._slider_dragging.get(media_name, False):
+            return
+
+        player = self._media_player(media_name)
+        # Paused or stopped media have not moved
+        if not player or player.playbackState() != _PLAYING:
+            return
+        duration = player.duration()
+        if duration <= 0:
+            return
+
+        # Get the corresponding slider
+        slider = self._media_sliders.get(media_name)
+
+        if slider:
+            # Calculate progress (0-1000); most ticks land on the value already shown
+            progress = player.position() * 1000 // duration
+            if self._last_progress.get(media_name) == progress:
                 return
-            
-            # Get the corresponding slider
-            slider_mapping = {
-                'media1': 'horizontalSlider',
-                'media2': 'horizontalSlider_2',
-                'media3': 'horizontalSlider_3'
-            }
-            
-            slider_name = slider_mapping.get(media_name)
-            slider = getattr(self.window, slider_name, None) if slider_name else None
-            
-            if slider:
-                # Calculate progress (0-1000)
-                progress = int((player.position() / player.duration()) * 1000)
+            with QSignalBlocker(slider):
                 slider.setValue(progress)
-                
-        except Exception as e:
-            print(f"Error updating progress for {media_name}: {e}")
-    
+            self._last_progress[media_name] = progress
+
     def update_media_button_state(self, media_name):
         """Update the media control button state based on player state"""
-        try:
-            player = self.media_players.get(media_name)
-            if not player:
+        if self.window is None:
+            return
+        player = self._media_player(media_name)
+        if not player:
+            return
+
+        # Get the corresponding button (skipped once the UI has been torn down)
+        button = self._btn_play.get(media_name)
+
+        if button is not None and not sip.isdeleted(button):
+            is_playing = player.playbackState() == _PLAYING
+            # setIcon repaints the button, so leave it alone when the state is unchanged
+            if self._last_play_state.get(media_name) == is_playing:
                 return
-                
-            # Get the corresponding button
-            button_mapping = {
-                'media1': 'pushButton_19',
-                'media2': 'pushButton_20', 
-                'media3': 'pushButton_21'
-            }
-            
-            button_name = button_mapping.get(media_name)
-            button = getattr(self.window, button_name, None) if button_name else None
-            
-            if button:
-                from PyQt6.QtMultimedia import QMediaPlayer
-                is_playing = player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
-                
-                button.setChecked(is_playing)
-                
-                # Update icon based on state
-                if is_playing and hasattr(button, 'pause_icon'):
-                    button.setIcon(button.pause_icon)
-                elif not is_playing and hasattr(button, 'play_icon'):
-                    button.setIcon(button.play_icon)
-                    
-        except Exception as e:
-            print(f"Error updating button state for {media_name}: {e}")
 
+            button.setChecked(is_playing)
+
+            # Update icon based on state
+            if is_playing and hasattr(button, 'pause_icon'):
+                button.setIcon(button.pause_icon)
+            elif not is_playing and hasattr(button, 'play_icon'):
+                button.setIcon(button.play_icon)
+            self._last_play_state[media_name] = is_playing
 
 def main():
+    # Diagnostics go through logging; only warnings and errors are shown by default
+    logging.basicConfig(level=logging.WARNING)
+
     # Enable high DPI scaling
     QApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
 
     app = QApplication(sys.argv)
+    QtGui.QPixmapCache.setCacheLimit(EFFECT_PIXMAP_CACHE_KB)
     app.setApplicationName("GoLive Studio (UI Only)")
     app.setApplicationVersion("1.0")
 
@@ -1513,30 +1841,11 @@ def main():
     window = uic.loadUi(str(ui_path))
 
     # --- Apply Icons ---
-    icon_path = Path(__file__).resolve().parent / "icons"
-    if hasattr(window, 'audioTopButton') and window.audioTopButton:
-        window.audioTopButton.setIcon(QtGui.QIcon(str(icon_path / "Volume.png")))
-    # Record panel icons
-    if hasattr(window, 'settingsRecordButton') and window.settingsRecordButton:
-        window.settingsRecordButton.setIcon(QtGui.QIcon(str(icon_path / "Settings.png")))
-    if hasattr(window, 'recordRedCircle') and window.recordRedCircle:
-        window.recordRedCircle.setIcon(QtGui.QIcon(str(icon_path / "Record.png")))
-    if hasattr(window, 'playButton') and window.playButton:
-        window.playButton.setIcon(QtGui.QIcon(str(icon_path / "Play.png")))
-    if hasattr(window, 'captureButton') and window.captureButton:
-        window.captureButton.setIcon(QtGui.QIcon(str(icon_path / "capture.png")))
-    window.stream1SettingsBtn.setIcon(QtGui.QIcon(str(icon_path / "Settings.png")))
-    window.stream1AudioBtn.setIcon(QtGui.QIcon(str(icon_path / "Stream.png")))
-    window.stream2SettingsBtn.setIcon(QtGui.QIcon(str(icon_path / "Settings.png")))
-    window.stream2AudioBtn.setIcon(QtGui.QIcon(str(icon_path / "Stream.png")))
-
-    # Input and Media Panel Settings Icons
-    window.input1SettingsButton.setIcon(QtGui.QIcon(str(icon_path / "Settings.png")))
-    window.input2SettingsButton.setIcon(QtGui.QIcon(str(icon_path / "Settings.png")))
-    window.input3SettingsButton.setIcon(QtGui.QIcon(str(icon_path / "Settings.png")))
-    window.media1SettingsButton.setIcon(QtGui.QIcon(str(icon_path / "Settings.png")))
-    window.media2SettingsButton.setIcon(QtGui.QIcon(str(icon_path / "Settings.png")))
-    window.media3SettingsButton.setIcon(QtGui.QIcon(str(icon_path / "Settings.png")))
+    # One QIcon per file; buttons sharing an image share the decoded icon
+    for attr, icon_name in _ICON_TABLE:
+        widget = getattr(window, attr, None)
+        if widget:
+            widget.setIcon(_IconCache.get(icon_name))
 
     # Initialize graphics output manager
     graphics_manager = GraphicsOutputManager(window)
@@ -1550,15 +1859,21 @@ def main():
         graphics_widget = graphics_manager.create_output_widget("main_output", window.outputPreview)
         
         # Clear existing layout and add graphics widget
-        if window.outputPreview.layout():
-            # Clear existing widgets
-            while window.outputPreview.layout().count():
-                child = window.outputPreview.layout().takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
+        layout = window.outputPreview.layout()
+        if layout:
+            # Clear existing widgets, popping from the end so the item list never shifts
+            layout.blockSignals(True)
+            try:
+                for i in range(layout.count() - 1, -1, -1):
+                    child = layout.takeAt(i)
+                    w = child.widget() if child else None
+                    if w:
+                        w.setParent(None)
+                        w.deleteLater()
+            finally:
+                layout.blockSignals(False)
         else:
             # Create layout if it doesn't exist
-            from PyQt6.QtWidgets import QVBoxLayout
             layout = QVBoxLayout(window.outputPreview)
             layout.setContentsMargins(0, 0, 0, 0)
         
@@ -1566,6 +1881,27 @@ def main():
         window.outputPreview.layout().addWidget(graphics_widget)
         print("Graphics output widget created and integrated")
     
+    # Initialize effects manager
+    effects_manager = EffectsManager(window)
+    
+    # Set up effects tabs with their corresponding widgets and layouts
+    tab_widgets_dict = {
+        "Web01": (window.scrollAreaWidgetContents_web01, window.gridLayout_8),
+        "Web02": (window.scrollAreaWidgetContents_web02, window.gridLayout_2),
+        "Web03": (window.scrollAreaWidgetContents_web03, window.gridLayout_3),
+        "God01": (window.scrollAreaWidgetContents_god01, window.gridLayout_4),
+        "Muslim": (window.scrollAreaWidgetContents_muslim, window.gridLayout_5),
+        "Stage": (window.scrollAreaWidgetContents_stage, window.gridLayout_6),
+        "Telugu": (window.scrollAreaWidgetContents_telugu, window.gridLayout_7)
+    }
+    
+    # Pre-analyze all PNG effects on a worker thread; the tabs are populated when it
+    # finishes, so neither GStreamer start-up nor window.show() waits for it
+    effects_folder = Path(__file__).parent / "effects"
+    effects_ready = _TaskSignals(window)
+    effects_ready.finished.connect(partial(effects_manager.refresh_all_tabs, tab_widgets_dict))
+    QThreadPool.globalInstance().start(_EffectsPreanalysis(str(effects_folder), effects_ready))
+
     # Initialize audio compositor (GStreamer) and start it
     audio_compositor = AudioCompositor()
     audio_compositor.start()
@@ -1581,34 +1917,13 @@ def main():
     # Connect video manager to graphics widget's video item
     video_item = graphics_manager.get_video_item_for_output("main_output")
     if video_item:
-        video_input_manager.output_preview_widget = video_item
+        video_input_manager.attach_output_item(video_item)
         print("Video manager connected to graphics video item")
     else:
         print("Warning: Could not connect video manager to graphics video item")
     
     # Do not pre-attach audio inputs. Mic/audio activates only when a source is switched to output.
 
-    # Initialize effects manager
-    effects_manager = EffectsManager(window)
-    
-    # Pre-analyze all PNG effects for faster loading
-    effects_folder = Path(__file__).parent / "effects"
-    preanalyze_effects_folder(str(effects_folder))
-    
-    # Set up effects tabs with their corresponding widgets and layouts
-    tab_widgets_dict = {
-        "Web01": (window.scrollAreaWidgetContents_web01, window.gridLayout_8),
-        "Web02": (window.scrollAreaWidgetContents_web02, window.gridLayout_2),
-        "Web03": (window.scrollAreaWidgetContents_web03, window.gridLayout_3),
-        "God01": (window.scrollAreaWidgetContents_god01, window.gridLayout_4),
-        "Muslim": (window.scrollAreaWidgetContents_muslim, window.gridLayout_5),
-        "Stage": (window.scrollAreaWidgetContents_stage, window.gridLayout_6),
-        "Telugu": (window.scrollAreaWidgetContents_telugu, window.gridLayout_7)
-    }
-    
-    # Populate all effects tabs
-    effects_manager.refresh_all_tabs(tab_widgets_dict)
-    
     # Connect effects selection signal
     def on_effect_selected(tab_name, effect_path):
         print(f"Effect selected in {tab_name}: {effect_path}")
@@ -1649,31 +1964,6 @@ def main():
     window.stream1AudioBtn.clicked.connect(stream1_control.open_settings_dialog)
     window.stream2AudioBtn.clicked.connect(stream2_control.open_settings_dialog)
 
-    # Setup cleanup on application exit
-    def cleanup_on_exit():
-        """Ensure all resources are released when the app closes."""
-        print("Cleaning up resources...")
-        try:
-            # Stop all streams
-            stream_manager.stop_all_streams()
-
-            # Stop recording
-            recording_manager.stop_recording()
-
-            # Cleanup video inputs
-            video_input_manager.cleanup_resources()
-
-            # Clear graphics effects
-            graphics_manager.clear_all_frames()
-
-            # Stop audio compositor
-            audio_compositor.stop()
-
-            print("Cleanup completed successfully")
-        except Exception as e:
-            print(f"Error during cleanup: {e}")
-    app.aboutToQuit.connect(cleanup_on_exit)
-
     # Recording Manager Setup
     ac_channel = audio_compositor.channel_name
     recording_manager = RecordingManager(audio_channel=ac_channel)
@@ -1714,16 +2004,15 @@ def main():
         manager_config['audio_bitrate'] = 128 # Hardcoded for now
         manager_config['video_format'] = config['video_format'].lower()
 
-        now = QDateTime.currentDateTime()
-        date_str = now.toString('yyyy-MM-dd')
-        time_str = now.toString('HH-mm-ss')
-        
+        ts = QDateTime.currentDateTime().toString('yyyy-MM-dd_HH-mm-ss')
+
         # Always include timestamp even if pattern doesn't have placeholders
         pattern = config['file_name_pattern']
         if '{date}' not in pattern and '{time}' not in pattern:
             # Add timestamp to prevent overwrites
-            filename = f"{pattern}_{date_str}_{time_str}"
+            filename = f"{pattern}_{ts}"
         else:
+            date_str, time_str = ts.split('_', 1)
             filename = pattern.replace('{date}', date_str).replace('{time}', time_str)
         
         filename += f".{manager_config['video_format']}"
@@ -1751,10 +2040,11 @@ def main():
         if dialog.exec():
             new_settings = dialog.get_settings()
             settings = QSettings("GoLive", "GoLiveApp")
+            settings.beginGroup('recording')
             for key, value in new_settings.items():
                 if value is not None:
-                    settings.setValue(f'recording/{key}', value)
-            
+                    settings.setValue(key, value)
+            settings.endGroup()
             settings.sync()
             print(f"Recording settings saved and applied: {new_settings}")
 
@@ -1769,67 +2059,19 @@ def main():
     # Access graphics output widget for screenshots
     graphics_widget = graphics_manager.get_output_widget("main_output")
 
-    def take_screenshot():
-        if not graphics_widget:
-            return
-
-        settings = QSettings("GoLive", "GoLiveApp")
-        custom_dir = settings.value("recording/custom_screenshot_path", "")
-        video_dir = settings.value("recording/destination_folder", os.path.join(os.path.expanduser('~'), 'Videos'))
-        ss_format = settings.value("recording/screenshot_format", "PNG").lower()
-
-        # Prefer explicit screenshot folder if provided; otherwise use recording destination
-        save_dir = custom_dir if (custom_dir and os.path.isdir(custom_dir)) else video_dir
-        if not save_dir or not os.path.isdir(save_dir):
-            save_dir = os.path.join(os.path.expanduser('~'), 'Pictures')
-            print(f"Screenshot path not set or invalid, falling back to: {save_dir}")
-
-        try:
-            os.makedirs(save_dir, exist_ok=True)
-            timestamp = QDateTime.currentDateTime().toString("yyyyMMdd_HHmmss")
-            filename = f"Screenshot_{timestamp}.{ss_format}"
-            filepath = os.path.join(save_dir, filename)
-
-            pixmap = graphics_widget.grab()
-            if pixmap.save(filepath):
-                print(f"Screenshot saved to {filepath}")
-            else:
-                print(f"Failed to save screenshot to {filepath}.")
-        except Exception as e:
-            print(f"Error taking screenshot: {e}")
-
-    if screenshot_btn:
-        screenshot_btn.clicked.connect(take_screenshot)
-
     # Initial state
     state = {
         'is_recording': False, # True when recording or paused
         'is_paused': False,
         'elapsed': 0,
+        'half_ticks': 0, # 500 ms ticks since recording started
         'blink_on': False
     }
 
-    # Default recording settings
-    try:
-        from PyQt6.QtCore import QStandardPaths
-        videos_path = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.MoviesLocation)
-        default_rec_path = Path(videos_path) / "GoLive_Recording.mp4"
-        rec_settings = {
-            'resolution': '1280x720',
-            'fps': 30,
-            'video_bitrate': 4000, # kbps
-            'audio_bitrate': 128, # kbps
-            'output_path': str(default_rec_path)
-        }
-        recording_manager.configure_recording(rec_settings)
-    except Exception as e:
-        print(f"[Main] Error setting default recording config: {e}")
-
-    # Timers
+    # One 500 ms timer drives both the blink and (every other tick) the elapsed seconds
     elapsed_timer = QTimer(window)
-    elapsed_timer.setInterval(1000)
-    blink_timer = QTimer(window)
-    blink_timer.setInterval(500)
+    elapsed_timer.setTimerType(Qt.TimerType.CoarseTimer)
+    elapsed_timer.setInterval(500)
 
     def _format_time(sec: int) -> str:
         h = sec // 3600
@@ -1848,8 +2090,7 @@ def main():
     def _set_status_recording(is_resuming=False):
         # blinking red dot
         if status_icon:
-            color = "#ff3b30" if state['blink_on'] else "#551111"
-            status_icon.setStyleSheet(f"background-color: {color}; border-radius: 6px;")
+            status_icon.setStyleSheet(_REC_ON_CSS if state['blink_on'] else _REC_OFF_CSS)
         if status_text:
             elapsed_str = _format_time(state['elapsed'])
             if is_resuming:
@@ -1875,18 +2116,20 @@ def main():
         if status_text:
             status_text.setText("Ready")
 
-    def _on_elapsed_tick():
-        state['elapsed'] += 1
-        if state['is_recording'] and not state['is_paused']:
-            _set_status_recording()
-
-    def _on_blink_tick():
+    def _on_status_tick():
+        state['half_ticks'] += 1
+        if state['half_ticks'] % 2 == 0:
+            state['elapsed'] += 1
         state['blink_on'] = not state['blink_on']
-        if state['is_recording'] and not state['is_paused']:
-            _set_status_recording()
+        if not state['is_recording'] or state['is_paused']:
+            return
+        # The dot blinks every tick; the text only changes when a whole second has passed
+        if status_icon:
+            status_icon.setStyleSheet(_REC_ON_CSS if state['blink_on'] else _REC_OFF_CSS)
+        if status_text and state['half_ticks'] % 2 == 0:
+            status_text.setText(f"REC {_format_time(state['elapsed'])}")
 
-    elapsed_timer.timeout.connect(_on_elapsed_tick)
-    blink_timer.timeout.connect(_on_blink_tick)
+    elapsed_timer.timeout.connect(_on_status_tick)
 
     def start_recording():
         manager_config = get_recording_config_from_settings()
@@ -1933,7 +2176,7 @@ def main():
                 return
 
             # Get screenshot settings
-            settings = QSettings()
+            settings = QSettings("GoLive", "GoLiveApp")
             ss_location = settings.value('recording/screenshot_location', 'Same as video')
             ss_format = settings.value('recording/screenshot_format', 'PNG').lower()
             
@@ -1957,8 +2200,11 @@ def main():
             out_dir.mkdir(parents=True, exist_ok=True)
             out_path = out_dir / file_name
             
-            ok = pixmap.save(str(out_path), ss_format)
-            print(f"Screenshot {'saved to' if ok else 'failed saving to'} {out_path}")
+            # Encoding a full-resolution frame takes tens of ms; do it on a worker thread.
+            # Only JPEG gets an explicit quality: for PNG, Qt maps quality to the zlib level
+            # and 90 would mean no compression, so other formats keep Qt's default (-1)
+            quality = 90 if ss_format in ('jpg', 'jpeg') else -1
+            QThreadPool.globalInstance().start(_SaveImage(pixmap.toImage(), str(out_path), ss_format, quality))
 
         except Exception as e:
             print(f"Screenshot error: {e}")
@@ -1989,8 +2235,8 @@ def main():
         state['is_recording'] = True
         state['is_paused'] = False
         state['elapsed'] = 0
-        elapsed_timer.start(1000)
-        blink_timer.start(500)
+        state['half_ticks'] = 0
+        elapsed_timer.start()
         _set_status_recording()
         if record_btn:
             record_btn.setChecked(True)
@@ -2001,7 +2247,6 @@ def main():
         state['is_recording'] = False
         state['is_paused'] = False
         elapsed_timer.stop()
-        blink_timer.stop()
         _set_status_stopped()
         if record_btn:
             record_btn.setChecked(False)
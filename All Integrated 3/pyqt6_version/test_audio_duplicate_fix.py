@@ -101,7 +101,7 @@ class AudioDuplicateFixTest(QWidget):
             methods_to_check = [
                 '_remove_all_media_from_audio_compositor',
                 '_set_media_audio_volume',
-                '_mute_all_media_audio'
+                '_set_exclusive_media_audio'
             ]
             
             for method_name in methods_to_check:
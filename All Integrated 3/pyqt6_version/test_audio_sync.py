@@ -89,7 +89,7 @@ class AudioSyncTest(QWidget):
             # Check if audio sync methods are present
             methods_to_check = [
                 '_set_media_audio_volume',
-                '_mute_all_media_audio'
+                '_set_exclusive_media_audio'
             ]
             
             for method_name in methods_to_check: